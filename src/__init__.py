@@ -7,11 +7,35 @@ Similar to Sonarr/Radarr but for subtitle automation.
 
 __version__ = "0.1.0"
 
-from .transcriber import Transcriber, TranscriberConfig
-from .subtitle_generator import SubtitleGenerator
-from .translator import Translator, TranslatorConfig, LLMProvider
+from importlib import import_module
+
 from .config_loader import Config
-from .processor import FileProcessor
+
+# Re-exports loaded on first access (PEP 562) so that importing the package
+# does not pull in whisper/torch or the LLM SDKs
+_LAZY = {
+    "Transcriber": ("transcriber", "Transcriber"),
+    "TranscriberConfig": ("transcriber", "TranscriberConfig"),
+    "SubtitleGenerator": ("subtitle_generator", "SubtitleGenerator"),
+    "Translator": ("translator", "Translator"),
+    "TranslatorConfig": ("translator", "TranslatorConfig"),
+    "LLMProvider": ("translator", "LLMProvider"),
+    "FileProcessor": ("processor", "FileProcessor"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module, attr = _LAZY[name]
+        value = getattr(import_module(f".{module}", __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+
 
 __all__ = [
     "Transcriber",
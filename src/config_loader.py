@@ -5,10 +5,26 @@ Handles loading and managing application configuration.
 """
 
 import os
+import copy
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +34,15 @@ class Config:
 
     DEFAULT_CONFIG = {
         "whisper": {
+            "backend": "faster-whisper",
             "model_size": "base",
             "language": None,
             "task": "transcribe",
             "device": None,
-            "compute_type": "float16"
+            "compute_type": "float16",
+            "max_parallel_gpu": 1,
+            "chunked": False,
+            "chunk_workers": 4
         },
         "translation": {
             "enabled": False,
@@ -31,7 +51,8 @@ class Config:
             "api_key": None,
             "target_language": "English",
             "preserve_timing": True,
-            "context_aware": True
+            "context_aware": True,
+            "concurrency": 8
         },
         "subtitle": {
             "format": "srt",
@@ -44,7 +65,10 @@ class Config:
             "video_extensions": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"],
             "audio_extensions": [".mp3", ".wav", ".flac", ".aac", ".m4a", ".ogg"],
             "overwrite_existing": False,
-            "auto_detect_language": True
+            "skip_if_newer": True,
+            "min_size_bytes": 1024,
+            "auto_detect_language": True,
+            "concurrency": None
         },
         "logging": {
             "level": "INFO",
@@ -52,6 +76,9 @@ class Config:
         }
     }
 
+    # Parsed config files keyed by absolute path: (mtime_ns, parsed dict)
+    _PARSE_CACHE: Dict[str, Tuple[int, Dict]] = {}
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize configuration
@@ -60,7 +87,8 @@ class Config:
             config_path: Path to configuration file (JSON)
         """
         self.config_path = config_path
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        self._cache: Dict[str, Any] = {}
 
         if config_path and os.path.exists(config_path):
             self.load_config(config_path)
@@ -75,8 +103,7 @@ class Config:
         logger.info(f"Loading configuration from: {config_path}")
 
         try:
-            with open(config_path, 'r') as f:
-                user_config = json.load(f)
+            user_config = self._read_config_file(config_path)
 
             # Deep merge user config with defaults
             self._merge_config(self.config, user_config)
@@ -86,6 +113,28 @@ class Config:
             logger.error(f"Error loading configuration: {e}")
             logger.warning("Using default configuration")
 
+    @classmethod
+    def _read_config_file(cls, config_path: str) -> Dict:
+        """
+        Parse a JSON config file, reusing the previous parse if the file is unchanged
+
+        Args:
+            config_path: Path to configuration file
+
+        Returns:
+            Parsed configuration (a private copy the caller may mutate)
+        """
+        path = os.path.abspath(config_path)
+        mtime = os.stat(path).st_mtime_ns
+
+        cached = cls._PARSE_CACHE.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'rb') as f:
+                cached = (mtime, _json_loads(f.read()))
+            cls._PARSE_CACHE[path] = cached
+
+        return copy.deepcopy(cached[1])
+
     def _merge_config(self, base: Dict, override: Dict):
         """
         Recursively merge override config into base config
@@ -94,6 +143,7 @@ class Config:
             base: Base configuration dictionary
             override: Override configuration dictionary
         """
+        self._cache.clear()
         for key, value in override.items():
             if key in base and isinstance(base[key], dict) and isinstance(value, dict):
                 self._merge_config(base[key], value)
@@ -111,6 +161,11 @@ class Config:
         Returns:
             Configuration value
         """
+        try:
+            return self._cache[key_path]
+        except KeyError:
+            pass
+
         keys = key_path.split('.')
         value = self.config
 
@@ -120,6 +175,7 @@ class Config:
             else:
                 return default
 
+        self._cache[key_path] = value
         return value
 
     def set(self, key_path: str, value: Any):
@@ -130,6 +186,7 @@ class Config:
             key_path: Configuration key path (e.g., "whisper.model_size")
             value: Value to set
         """
+        self._cache.clear()
         keys = key_path.split('.')
         config = self.config
 
@@ -149,8 +206,8 @@ class Config:
         """
         logger.info(f"Saving configuration to: {output_path}")
 
-        with open(output_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(_json_dumps(self.config))
 
         logger.info("Configuration saved successfully")
 
@@ -6,8 +6,8 @@ Handles processing of video/audio files for subtitle generation.
 
 import os
 import logging
-from pathlib import Path
-from typing import List, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Callable
 from .transcriber import Transcriber, TranscriberConfig
 from .subtitle_generator import SubtitleGenerator
 from .translator import Translator, TranslatorConfig
@@ -16,6 +16,41 @@ from .config_loader import Config
 logger = logging.getLogger(__name__)
 
 
+def _iter_media_files(root: str, exts_set: frozenset, recursive: bool) -> Iterator[os.DirEntry]:
+    """
+    Walk a directory once, yielding entries whose extension is supported
+
+    Args:
+        root: Directory to scan
+        exts_set: Lower-cased extensions (with leading dot) to match
+        recursive: Descend into subdirectories
+
+    Yields:
+        DirEntry objects for matching files (including symlinks to files)
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except PermissionError:
+            # Skip unreadable folders like Path.rglob does, rather than abort the run
+            logger.warning("Skipping unreadable directory: %s", path)
+            continue
+
+        with it:
+            for entry in it:
+                # Linked directories aren't traversed, but linked media files count
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    name = entry.name
+                    ext = name[name.rfind('.'):].lower() if '.' in name else ''
+                    if ext in exts_set:
+                        yield entry
+
+
 class FileProcessor:
     """Processes video/audio files to generate subtitles"""
 
@@ -32,11 +67,26 @@ class FileProcessor:
             language=config.get("whisper.language"),
             task=config.get("whisper.task", "transcribe"),
             device=config.get("whisper.device"),
-            compute_type=config.get("whisper.compute_type", "float16")
+            compute_type=config.get("whisper.compute_type", "float16"),
+            max_parallel_gpu=config.get("whisper.max_parallel_gpu", 1),
+            backend=config.get("whisper.backend", "faster-whisper"),
+            chunked=config.get("whisper.chunked", False),
+            chunk_workers=config.get("whisper.chunk_workers", 4),
+            auto_detect_language=config.get("processing.auto_detect_language", True)
         )
         self.transcriber = Transcriber(self.transcriber_config)
         self.subtitle_generator = SubtitleGenerator()
 
+        # Settings consulted for every file
+        self._subtitle_format = config.get("subtitle.format", "srt")
+        self._overwrite = config.get("processing.overwrite_existing", False)
+        self._skip_if_newer = config.get("processing.skip_if_newer", True)
+        self._min_size = config.get("processing.min_size_bytes", 1024)
+        self._ext_set = frozenset(
+            e.lower()
+            for e in config.get("processing.video_extensions", []) + config.get("processing.audio_extensions", [])
+        )
+
         # Initialize translator if translation is enabled
         self.translator = None
         if config.get("translation.enabled", False):
@@ -46,7 +96,8 @@ class FileProcessor:
                 api_key=config.get("translation.api_key"),
                 target_language=config.get("translation.target_language", "English"),
                 preserve_timing=config.get("translation.preserve_timing", True),
-                context_aware=config.get("translation.context_aware", True)
+                context_aware=config.get("translation.context_aware", True),
+                concurrency=config.get("translation.concurrency", 8)
             )
             self.translator = Translator(self.translator_config)
 
@@ -55,7 +106,8 @@ class FileProcessor:
         input_path: str,
         output_path: Optional[str] = None,
         subtitle_format: Optional[str] = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        input_stat: Optional[os.stat_result] = None
     ) -> str:
         """
         Process a single video/audio file
@@ -65,28 +117,39 @@ class FileProcessor:
             output_path: Path to output subtitle file (auto-generated if None)
             subtitle_format: Subtitle format (srt or vtt)
             progress_callback: Optional callback for progress updates
+            input_stat: Already-known stat result for input_path
 
         Returns:
             Path to generated subtitle file
         """
-        input_path = Path(input_path)
+        input_path = os.fspath(input_path)
 
-        if not input_path.exists():
+        if not os.path.exists(input_path):
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
         # Determine output path
         if output_path is None:
-            subtitle_format = subtitle_format or self.config.get("subtitle.format", "srt")
-            output_path = input_path.with_suffix(f".{subtitle_format}")
+            subtitle_format = subtitle_format or self._subtitle_format
+            output_path = f"{os.path.splitext(input_path)[0]}.{subtitle_format}"
         else:
-            output_path = Path(output_path)
-            subtitle_format = subtitle_format or output_path.suffix.lstrip('.')
+            output_path = os.fspath(output_path)
+            subtitle_format = subtitle_format or os.path.splitext(output_path)[1].lstrip('.')
 
         # Check if output already exists
-        if output_path.exists() and not self.config.get("processing.overwrite_existing", False):
+        if os.path.exists(output_path) and not self._overwrite:
             logger.warning(f"Subtitle file already exists: {output_path}")
             logger.warning("Skipping (set overwrite_existing=true to overwrite)")
-            return str(output_path)
+            return output_path
+
+        # Skip if the subtitle is already newer than its source
+        if self._skip_if_newer:
+            try:
+                source_mtime = (input_stat or os.stat(input_path)).st_mtime
+                if os.stat(output_path).st_mtime >= source_mtime:
+                    logger.info(f"Subtitle file is up to date, skipping: {output_path}")
+                    return output_path
+            except FileNotFoundError:
+                pass
 
         logger.info(f"Processing file: {input_path}")
 
@@ -94,7 +157,7 @@ class FileProcessor:
         if progress_callback:
             progress_callback("transcribing", 0)
 
-        result = self.transcriber.transcribe(str(input_path))
+        result = self.transcriber.transcribe(input_path)
         segments = self.transcriber.get_segments(result)
 
         if progress_callback:
@@ -117,7 +180,7 @@ class FileProcessor:
 
         subtitle_path = self.subtitle_generator.generate(
             segments,
-            str(output_path),
+            output_path,
             format=subtitle_format
         )
 
@@ -146,56 +209,60 @@ class FileProcessor:
         Returns:
             List of paths to generated subtitle files
         """
-        input_dir = Path(input_directory)
-
-        if not input_dir.exists():
-            raise FileNotFoundError(f"Input directory not found: {input_dir}")
+        input_directory = os.fspath(input_directory)
+        if not os.path.isdir(input_directory):
+            raise FileNotFoundError(f"Input directory not found: {input_directory}")
 
-        output_dir = Path(output_directory) if output_directory else input_dir
-
-        # Get supported file extensions
-        video_extensions = self.config.get("processing.video_extensions", [])
-        audio_extensions = self.config.get("processing.audio_extensions", [])
-        supported_extensions = video_extensions + audio_extensions
+        output_directory = os.fspath(output_directory) if output_directory else input_directory
 
-        # Find all media files
+        # Find all media files in a single pass over the tree, dropping empty/truncated ones
         media_files = []
-        if recursive:
-            for ext in supported_extensions:
-                media_files.extend(input_dir.rglob(f"*{ext}"))
-        else:
-            for ext in supported_extensions:
-                media_files.extend(input_dir.glob(f"*{ext}"))
+        skipped = 0
+        for entry in _iter_media_files(input_directory, self._ext_set, recursive):
+            if entry.stat().st_size < self._min_size:
+                logger.warning("Skipping file smaller than %d bytes: %s", self._min_size, entry.path)
+                skipped += 1
+                continue
+            media_files.append(entry)
 
+        if skipped:
+            logger.info(f"Skipped {skipped} undersized files")
         logger.info(f"Found {len(media_files)} media files to process")
 
-        # Process each file
-        generated_files = []
-        for idx, media_file in enumerate(media_files, start=1):
-            try:
-                logger.info(f"Processing file {idx}/{len(media_files)}: {media_file.name}")
+        # Determine output paths (preserve directory structure)
+        jobs = []
+        for entry in media_files:
+            rel = entry.path[len(input_directory):].lstrip(os.sep)
+            stem, _ = os.path.splitext(rel)
+            output_path = os.path.join(output_directory, f"{stem}.{self._subtitle_format}")
 
-                # Determine output path (preserve directory structure)
-                relative_path = media_file.relative_to(input_dir)
-                output_path = output_dir / relative_path.with_suffix(
-                    f".{self.config.get('subtitle.format', 'srt')}"
-                )
+            # Create output directory if needed
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            jobs.append((entry, output_path))
 
-                # Create output directory if needed
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Process files concurrently; results are collected in submission order
+        workers = self.config.get("processing.concurrency") or min(os.cpu_count() or 1, 4)
+        logger.info(f"Processing with {workers} worker(s)")
 
-                # Process file
-                subtitle_path = self.process_file(
-                    str(media_file),
-                    str(output_path),
-                    progress_callback=progress_callback
+        generated_files = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self.process_file,
+                    entry.path,
+                    output_path,
+                    progress_callback=progress_callback,
+                    input_stat=entry.stat()
                 )
-
-                generated_files.append(subtitle_path)
-
-            except Exception as e:
-                logger.error(f"Error processing {media_file}: {e}")
-                continue
+                for entry, output_path in jobs
+            ]
+
+            for idx, ((entry, _), future) in enumerate(zip(jobs, futures), start=1):
+                try:
+                    generated_files.append(future.result())
+                    logger.info("Finished file %d/%d: %s", idx, len(jobs), entry.name)
+                except Exception as e:
+                    logger.error(f"Error processing {entry.path}: {e}")
 
         logger.info(f"Successfully processed {len(generated_files)}/{len(media_files)} files")
         return generated_files
@@ -7,15 +7,89 @@ Converts transcription results into subtitle files (SRT, VTT formats).
 import os
 import logging
 from pathlib import Path
-from typing import List, Dict
-from datetime import timedelta
+from typing import List, Dict, Optional, Sequence, Callable
 
 logger = logging.getLogger(__name__)
 
+# Subtitle files are written in one call; stage it through a 1 MiB buffer
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Below this many timestamps the numba JIT overhead outweighs the gain
+JIT_MIN_TIMESTAMPS = 2000
+
+# Largest time (exclusive) that fits the fixed-width HH:MM:SS,mmm layout
+_MAX_FIXED_WIDTH_SECONDS = 100 * 3600
+
+# Compiled timestamp kernel; False once numba turned out to be missing.
+# Built on first use since importing numba costs ~0.3 s at startup.
+_timestamp_kernel = None
+
+
+def _get_timestamp_kernel() -> Optional[Callable]:
+    """
+    Return the numba-compiled timestamp formatter, compiling it on first use
+
+    Returns:
+        The kernel, or None if numba or numpy is not installed
+    """
+    global _timestamp_kernel
+    if _timestamp_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _timestamp_kernel = False
+        else:
+            _timestamp_kernel = njit(cache=True)(_fill_timestamps)
+    return _timestamp_kernel or None
+
+
+def _fill_timestamps(seconds, sep, out):
+    """Write HH:MM:SS<sep>mmm as ASCII digits into each 12-byte row of out"""
+    for i in range(seconds.shape[0]):
+        ms_total = int(seconds[i] * 1000.0 + 0.5)
+        hours = ms_total // 3_600_000
+        rem = ms_total % 3_600_000
+        minutes = rem // 60_000
+        rem = rem % 60_000
+        secs = rem // 1000
+        millis = rem % 1000
+
+        out[i, 0] = 48 + hours // 10
+        out[i, 1] = 48 + hours % 10
+        out[i, 2] = 58  # ':'
+        out[i, 3] = 48 + minutes // 10
+        out[i, 4] = 48 + minutes % 10
+        out[i, 5] = 58
+        out[i, 6] = 48 + secs // 10
+        out[i, 7] = 48 + secs % 10
+        out[i, 8] = sep
+        out[i, 9] = 48 + millis // 100
+        out[i, 10] = 48 + (millis // 10) % 10
+        out[i, 11] = 48 + millis % 10
+
 
 class SubtitleGenerator:
     """Generates subtitle files from transcription segments"""
 
+    @staticmethod
+    def _format_timestamp(seconds: float, sep: str) -> str:
+        """
+        Format timestamp as HH:MM:SS<sep>mmm
+
+        Args:
+            seconds: Time in seconds
+            sep: Separator between seconds and milliseconds
+
+        Returns:
+            Formatted timestamp string
+        """
+        ms_total = int(seconds * 1000 + 0.5)
+        hours, rem = divmod(ms_total, 3_600_000)
+        minutes, rem = divmod(rem, 60_000)
+        secs, millis = divmod(rem, 1000)
+
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{sep}{millis:03d}"
+
     @staticmethod
     def format_timestamp_srt(seconds: float) -> str:
         """
@@ -27,13 +101,7 @@ class SubtitleGenerator:
         Returns:
             Formatted timestamp string
         """
-        td = timedelta(seconds=seconds)
-        hours = int(td.total_seconds() // 3600)
-        minutes = int((td.total_seconds() % 3600) // 60)
-        secs = int(td.total_seconds() % 60)
-        millis = int((seconds % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        return SubtitleGenerator._format_timestamp(seconds, ",")
 
     @staticmethod
     def format_timestamp_vtt(seconds: float) -> str:
@@ -46,13 +114,63 @@ class SubtitleGenerator:
         Returns:
             Formatted timestamp string
         """
-        td = timedelta(seconds=seconds)
-        hours = int(td.total_seconds() // 3600)
-        minutes = int((td.total_seconds() % 3600) // 60)
-        secs = int(td.total_seconds() % 60)
-        millis = int((seconds % 1) * 1000)
+        return SubtitleGenerator._format_timestamp(seconds, ".")
+
+    @staticmethod
+    def _format_timestamps(values: Sequence[float], sep: str) -> List[str]:
+        """
+        Format many timestamps at once
+
+        Uses a numba-compiled formatter for long inputs when numba is
+        installed, otherwise formats each value in Python.
+
+        Args:
+            values: Times in seconds
+            sep: Separator between seconds and milliseconds
+
+        Returns:
+            Formatted timestamp strings
+        """
+        kernel = _get_timestamp_kernel() if len(values) >= JIT_MIN_TIMESTAMPS else None
+        if kernel is not None:
+            import numpy as np
+
+            arr = np.asarray(values, dtype=np.float64)
+            # Bound the rounded value: 359999.9996 s already rounds to hour 100
+            ms = np.floor(arr * 1000.0 + 0.5)
+            if ms.min() >= 0 and ms.max() < _MAX_FIXED_WIDTH_SECONDS * 1000:
+                out = np.empty((arr.shape[0], 12), dtype=np.uint8)
+                kernel(arr, ord(sep), out)
+                buf = out.tobytes().decode('ascii')
+                return [buf[i:i + 12] for i in range(0, len(buf), 12)]
+
+        fmt = SubtitleGenerator._format_timestamp
+        return [fmt(value, sep) for value in values]
+
+    @staticmethod
+    def _render_entries(segments: List[Dict], sep: str, header: str = "") -> str:
+        """
+        Render numbered subtitle entries into a single string
 
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+        Args:
+            segments: List of transcription segments
+            sep: Millisecond separator for timestamps
+            header: Text placed before the first entry
+
+        Returns:
+            Subtitle file content
+        """
+        n = len(segments)
+        stamps = SubtitleGenerator._format_timestamps(
+            [segment['start'] for segment in segments] + [segment['end'] for segment in segments],
+            sep
+        )
+
+        parts = [header]
+        append = parts.append
+        for idx, segment in enumerate(segments):
+            append(f"{idx + 1}\n{stamps[idx]} --> {stamps[n + idx]}\n{segment['text'].strip()}\n\n")
+        return "".join(parts)
 
     def generate_srt(
         self,
@@ -75,17 +193,10 @@ class SubtitleGenerator:
         """
         logger.info(f"Generating SRT file: {output_path}")
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for idx, segment in enumerate(segments, start=1):
-                start_time = self.format_timestamp_srt(segment['start'])
-                end_time = self.format_timestamp_srt(segment['end'])
-                text = segment['text'].strip()
+        content = self._render_entries(segments, ",")
 
-                # Write subtitle entry
-                f.write(f"{idx}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n")
-                f.write("\n")
+        with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(content)
 
         logger.info(f"SRT file generated with {len(segments)} entries")
         return output_path
@@ -111,19 +222,10 @@ class SubtitleGenerator:
         """
         logger.info(f"Generating VTT file: {output_path}")
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("WEBVTT\n\n")
-
-            for idx, segment in enumerate(segments, start=1):
-                start_time = self.format_timestamp_vtt(segment['start'])
-                end_time = self.format_timestamp_vtt(segment['end'])
-                text = segment['text'].strip()
+        content = self._render_entries(segments, ".", header="WEBVTT\n\n")
 
-                # Write subtitle entry
-                f.write(f"{idx}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n")
-                f.write("\n")
+        with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(content)
 
         logger.info(f"VTT file generated with {len(segments)} entries")
         return output_path
@@ -1,17 +1,23 @@
 """
 Whisparr Transcriber Module
 
-Handles audio/video transcription using OpenAI's Whisper model.
+Handles audio/video transcription using OpenAI's Whisper model, either through
+the faster-whisper (CTranslate2) backend or the reference openai-whisper package.
 """
 
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List
-import whisper
+from typing import Optional, Dict, Iterator, List, Tuple
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Sample rate of the decoded audio passed to the models
+SAMPLE_RATE = 16000
+
 
 class TranscriberConfig:
     """Configuration for the transcriber"""
@@ -22,7 +28,12 @@ class TranscriberConfig:
         language: Optional[str] = None,
         task: str = "transcribe",
         device: Optional[str] = None,
-        compute_type: str = "float16"
+        compute_type: str = "float16",
+        max_parallel_gpu: int = 1,
+        backend: str = "faster-whisper",
+        chunked: bool = False,
+        chunk_workers: int = 4,
+        auto_detect_language: bool = True
     ):
         """
         Initialize transcriber configuration
@@ -33,12 +44,24 @@ class TranscriberConfig:
             task: Task type (transcribe or translate)
             device: Device to use (cuda, cpu, or None for auto)
             compute_type: Computation precision (float16, int8, float32)
+            max_parallel_gpu: Maximum number of concurrent model forward passes
+                (one more file may be decoded ahead of them)
+            backend: Whisper implementation (faster-whisper or openai-whisper)
+            chunked: Split audio on VAD speech boundaries and transcribe chunks in parallel
+            chunk_workers: Number of worker threads used for chunked transcription
+                (chunks run concurrently only up to max_parallel_gpu)
+            auto_detect_language: Detect the language up front when none is set
         """
         self.model_size = model_size
         self.language = language
         self.task = task
         self.device = device
         self.compute_type = compute_type
+        self.max_parallel_gpu = max_parallel_gpu
+        self.backend = backend
+        self.chunked = chunked
+        self.chunk_workers = chunk_workers
+        self.auto_detect_language = auto_detect_language
 
 
 class Transcriber:
@@ -53,17 +76,48 @@ class Transcriber:
         """
         self.config = config
         self.model = None
+        self.vad_model = None
+        self._model_lock = threading.Lock()
+        self._inference_slots = threading.Semaphore(max(1, config.max_parallel_gpu))
+        # One decoded file may wait ahead of the running passes, bounding memory
+        self._decode_slots = threading.Semaphore(max(1, config.max_parallel_gpu) + 1)
         logger.info(f"Initializing transcriber with model size: {config.model_size}")
 
     def load_model(self):
         """Load the Whisper model"""
-        if self.model is None:
-            logger.info(f"Loading Whisper model: {self.config.model_size}")
-            self.model = whisper.load_model(
+        with self._model_lock:
+            if self.model is None:
+                logger.info(f"Loading Whisper model: {self.config.model_size} ({self.config.backend})")
+                if self.config.backend == "faster-whisper":
+                    self.model = self._load_faster_whisper_model()
+                elif self.config.backend == "openai-whisper":
+                    import whisper
+                    self.model = whisper.load_model(
+                        self.config.model_size,
+                        device=self.config.device
+                    )
+                else:
+                    raise ValueError(f"Unsupported Whisper backend: {self.config.backend}")
+                logger.info("Model loaded successfully")
+
+    def _load_faster_whisper_model(self):
+        """Load a faster-whisper (CTranslate2) model"""
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise ImportError("faster-whisper package not installed. Run: pip install faster-whisper")
+
+        device = self.config.device or "auto"
+        try:
+            return WhisperModel(
                 self.config.model_size,
-                device=self.config.device
+                device=device,
+                compute_type=self.config.compute_type
             )
-            logger.info("Model loaded successfully")
+        except ValueError as e:
+            # e.g. float16 requested on a CPU-only host
+            logger.warning(f"Compute type {self.config.compute_type} unavailable ({e}), using default")
+            return WhisperModel(self.config.model_size, device=device, compute_type="default")
 
     def transcribe(
         self,
@@ -75,7 +129,7 @@ class Transcriber:
 
         Args:
             audio_path: Path to audio/video file
-            **kwargs: Additional arguments to pass to whisper.transcribe()
+            **kwargs: Additional arguments to pass to the backend's transcribe()
 
         Returns:
             Dictionary containing transcription results with segments
@@ -91,21 +145,175 @@ class Transcriber:
         options = {
             "language": self.config.language,
             "task": self.config.task,
-            "verbose": False,
         }
+        if self.config.backend == "openai-whisper":
+            options["verbose"] = False
+        else:
+            options.update(vad_filter=True, beam_size=5)
         options.update(kwargs)
 
         # Remove None values
         options = {k: v for k, v in options.items() if v is not None}
 
-        # Transcribe
-        result = self.model.transcribe(audio_path, **options)
+        # Transcribe (bounded so concurrent callers don't exhaust GPU memory)
+        if self.config.chunked:
+            result = self._transcribe_chunked(audio_path, options)
+        else:
+            # Decode before taking a slot so ffmpeg work overlaps other files' forward passes;
+            # the decode slot is held until inference ends so only a bounded number of
+            # decoded arrays are alive at once
+            with self._decode_slots:
+                audio = self._decode_audio(audio_path)
+                with self._inference_slots:
+                    if self.config.backend != "faster-whisper" and "language" not in options and self.config.auto_detect_language:
+                        options = dict(options, language=self._detect_language(audio))
+                    result = self._run_model(audio, options)
+                del audio
 
         logger.info(f"Transcription complete. Detected language: {result.get('language', 'unknown')}")
         logger.info(f"Found {len(result.get('segments', []))} segments")
 
         return result
 
+    def _run_model(self, audio, options: Dict) -> Dict:
+        """
+        Run the loaded backend and return an openai-whisper style result
+
+        Args:
+            audio: Path to audio/video file, or 16 kHz float32 samples
+            options: Options passed to the backend's transcribe()
+
+        Returns:
+            Dictionary with segments, language and text keys
+        """
+        if self.config.backend != "faster-whisper":
+            return self.model.transcribe(audio, **options)
+
+        segments_iter, info = self.model.transcribe(audio, **options)
+        segments = [{"start": s.start, "end": s.end, "text": s.text} for s in segments_iter]
+
+        return {
+            "segments": segments,
+            "language": info.language,
+            "text": " ".join(s["text"].strip() for s in segments),
+        }
+
+    def _decode_audio(self, audio_path: str) -> np.ndarray:
+        """
+        Decode an audio/video file once with the backend's decoder
+
+        Args:
+            audio_path: Path to audio/video file
+
+        Returns:
+            16 kHz float32 samples, reused for language detection and transcription
+        """
+        if self.config.backend == "faster-whisper":
+            from faster_whisper import decode_audio
+            return decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+
+        import whisper
+        return whisper.load_audio(audio_path)
+
+    def _detect_language(self, audio: np.ndarray) -> str:
+        """
+        Detect the spoken language from the first 30 seconds of audio
+
+        Args:
+            audio: 16 kHz float32 samples
+
+        Returns:
+            Language code
+        """
+        import whisper
+
+        mel = whisper.log_mel_spectrogram(
+            whisper.pad_or_trim(audio),
+            self.model.dims.n_mels
+        ).to(self.model.device)
+        _, probs = self.model.detect_language(mel)
+        language = max(probs, key=probs.get)
+        logger.info(f"Detected language: {language}")
+        return language
+
+    def _load_vad_model(self):
+        """Load the Silero VAD model"""
+        with self._model_lock:
+            if self.vad_model is None:
+                try:
+                    from silero_vad import load_silero_vad
+                except ImportError:
+                    raise ImportError("silero-vad package not installed. Run: pip install silero-vad")
+                self.vad_model = load_silero_vad()
+        return self.vad_model
+
+    def _chunk_audio(self, audio_path: str) -> Iterator[Tuple[float, np.ndarray]]:
+        """
+        Split audio into speech chunks using Silero VAD
+
+        Args:
+            audio_path: Path to audio/video file
+
+        Yields:
+            Tuples of (chunk start in seconds, float32 sample array)
+        """
+        from silero_vad import get_speech_timestamps
+
+        audio = self._decode_audio(audio_path)
+        vad_model = self._load_vad_model()
+
+        for ts in get_speech_timestamps(audio, vad_model, sampling_rate=SAMPLE_RATE):
+            yield ts["start"] / SAMPLE_RATE, audio[ts["start"]:ts["end"]]
+
+    def _transcribe_chunked(self, audio_path: str, options: Dict) -> Dict:
+        """
+        Transcribe VAD speech chunks in parallel and merge the results
+
+        Args:
+            audio_path: Path to audio/video file
+            options: Options passed to the backend's transcribe()
+
+        Returns:
+            Dictionary with segments, language and text keys
+        """
+        chunks = list(self._chunk_audio(audio_path))
+        logger.info(f"Split audio into {len(chunks)} speech chunks")
+
+        def run(chunk, chunk_options):
+            with self._inference_slots:
+                return self._run_model(chunk[1], chunk_options)
+
+        results = []
+        if chunks and "language" not in options:
+            # Detect once and pin the language, so short utterances can't each
+            # guess a different one
+            results.append(run(chunks[0], options))
+            options = dict(options, language=results[0].get("language"))
+
+        # Chunks only run as fast as the inference slots allow
+        workers = max(1, min(self.config.chunk_workers, self.config.max_parallel_gpu))
+        if workers < self.config.chunk_workers:
+            logger.info(f"Chunked transcription limited to {workers} at a time by max_parallel_gpu")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results.extend(executor.map(lambda chunk: run(chunk, options), chunks[len(results):]))
+
+        # Shift chunk-relative timestamps back onto the source timeline
+        segments = []
+        for (offset, _), result in zip(chunks, results):
+            for segment in result.get("segments", []):
+                segment = dict(segment)
+                segment["start"] += offset
+                segment["end"] += offset
+                segments.append(segment)
+        segments.sort(key=lambda s: s["start"])
+
+        return {
+            "segments": segments,
+            "language": options.get("language", self.config.language),
+            "text": " ".join(s["text"].strip() for s in segments),
+        }
+
     def get_segments(self, result: Dict) -> List[Dict]:
         """
         Extract segments from transcription result
@@ -5,12 +5,58 @@ Handles translation of transcribed text using LLM APIs.
 """
 
 import os
+import re
+import asyncio
 import logging
-from typing import List, Dict, Optional
+import threading
+import importlib.util
+from collections import deque
+from typing import Any, Callable, List, Dict, Optional
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of context-free translations remembered per Translator
+TRANSLATION_CACHE_SIZE = 2048
+
+# Segment markers used by translate_batch ("[3] text")
+_BATCH_PREFIX = re.compile(r'^\[(\d+)\]\s*')
+_BATCH_SPLIT = re.compile(r'(?m)^(?=\[\d+\])')
+
+# Provider clients shared by all Translator instances, keyed on (provider, api_key)
+_CLIENT_CACHE: Dict[tuple, Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _http_client_options() -> Dict[str, Any]:
+    """Connection pool settings for provider HTTP clients"""
+    import httpx
+
+    return {
+        # HTTP/2 multiplexes concurrent requests over one connection (needs the h2 package)
+        "http2": importlib.util.find_spec("h2") is not None,
+        "limits": httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    }
+
+
+def _get_shared_client(key: tuple, factory: Callable[[], Any]) -> Any:
+    """Return the cached client for key, creating it with factory on first use"""
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = factory()
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def close_shared_clients():
+    """Close and forget every shared provider client (e.g. at shutdown or between tests)"""
+    with _CLIENT_CACHE_LOCK:
+        clients = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+    for client in clients:
+        client.close()
+
 
 class LLMProvider(Enum):
     """Supported LLM providers"""
@@ -29,7 +75,8 @@ class TranslatorConfig:
         api_key: Optional[str] = None,
         target_language: str = "English",
         preserve_timing: bool = True,
-        context_aware: bool = True
+        context_aware: bool = True,
+        concurrency: int = 8
     ):
         """
         Initialize translator configuration
@@ -41,6 +88,7 @@ class TranslatorConfig:
             target_language: Target language for translation
             preserve_timing: Keep original timing segments
             context_aware: Use context from previous segments
+            concurrency: Maximum in-flight requests when translating segments independently
         """
         self.provider = provider
         self.model = model or self._get_default_model(provider)
@@ -48,6 +96,7 @@ class TranslatorConfig:
         self.target_language = target_language
         self.preserve_timing = preserve_timing
         self.context_aware = context_aware
+        self.concurrency = concurrency
 
     def _get_default_model(self, provider: str) -> str:
         """Get default model for provider"""
@@ -80,13 +129,23 @@ class Translator:
         """
         self.config = config
         self.client = None
+        self._cache: Dict[tuple, str] = {}
+        # The processor's worker threads share one Translator
+        self._cache_lock = threading.Lock()
         logger.info(f"Initializing translator with provider: {config.provider}, model: {config.model}")
 
     def _init_openai_client(self):
         """Initialize OpenAI client"""
         try:
             import openai
-            self.client = openai.OpenAI(api_key=self.config.api_key)
+            import httpx
+            self.client = _get_shared_client(
+                ("openai", self.config.api_key),
+                lambda: openai.OpenAI(
+                    api_key=self.config.api_key,
+                    http_client=httpx.Client(**_http_client_options())
+                )
+            )
             logger.info("OpenAI client initialized")
         except ImportError:
             raise ImportError("openai package not installed. Run: pip install openai")
@@ -97,7 +156,14 @@ class Translator:
         """Initialize Anthropic client"""
         try:
             import anthropic
-            self.client = anthropic.Anthropic(api_key=self.config.api_key)
+            import httpx
+            self.client = _get_shared_client(
+                ("anthropic", self.config.api_key),
+                lambda: anthropic.Anthropic(
+                    api_key=self.config.api_key,
+                    http_client=httpx.Client(**_http_client_options())
+                )
+            )
             logger.info("Anthropic client initialized")
         except ImportError:
             raise ImportError("anthropic package not installed. Run: pip install anthropic")
@@ -114,6 +180,53 @@ class Translator:
             else:
                 raise ValueError(f"Unsupported provider: {self.config.provider}")
 
+    def _create_async_client(self):
+        """
+        Create an async client for the configured provider
+
+        Async HTTP connections are tied to the event loop that opened them, so
+        unlike the sync clients these are created per translate_segments() run
+        and closed afterwards.
+        """
+        import httpx
+
+        if self.config.provider == "openai":
+            try:
+                import openai
+            except ImportError:
+                raise ImportError("openai package not installed. Run: pip install openai")
+            return openai.AsyncOpenAI(
+                api_key=self.config.api_key,
+                http_client=httpx.AsyncClient(**_http_client_options())
+            )
+        elif self.config.provider == "anthropic":
+            try:
+                import anthropic
+            except ImportError:
+                raise ImportError("anthropic package not installed. Run: pip install anthropic")
+            return anthropic.AsyncAnthropic(
+                api_key=self.config.api_key,
+                http_client=httpx.AsyncClient(**_http_client_options())
+            )
+        else:
+            raise ValueError(f"Unsupported provider: {self.config.provider}")
+
+    def close(self):
+        """
+        Release this translator's client
+
+        The client is shared with other translators using the same provider and
+        key, so it stays open; use close_shared_clients() to close them all.
+        """
+        self.client = None
+
+    def _instruction(self) -> str:
+        """Build the translator instruction for the target language"""
+        return (
+            f"You are a professional translator. Translate the following text to {self.config.target_language}. "
+            "Preserve the meaning, tone, and style. Only return the translated text, nothing else."
+        )
+
     def _translate_with_openai(self, text: str, context: Optional[str] = None) -> str:
         """Translate text using OpenAI"""
         prompt = self._build_translation_prompt(text, context)
@@ -121,7 +234,7 @@ class Translator:
         response = self.client.chat.completions.create(
             model=self.config.model,
             messages=[
-                {"role": "system", "content": f"You are a professional translator. Translate the following text to {self.config.target_language}. Preserve the meaning, tone, and style. Only return the translated text, nothing else."},
+                {"role": "system", "content": self._instruction()},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3
@@ -137,13 +250,38 @@ class Translator:
             model=self.config.model,
             max_tokens=4096,
             messages=[
-                {"role": "user", "content": f"You are a professional translator. Translate the following text to {self.config.target_language}. Preserve the meaning, tone, and style. Only return the translated text, nothing else.\n\n{prompt}"}
+                {"role": "user", "content": f"{self._instruction()}\n\n{prompt}"}
             ],
             temperature=0.3
         )
 
         return response.content[0].text.strip()
 
+    async def _atranslate(self, client, text: str, context: Optional[str] = None) -> str:
+        """Translate text using an async provider client"""
+        prompt = self._build_translation_prompt(text, context)
+
+        if self.config.provider == "openai":
+            response = await client.chat.completions.create(
+                model=self.config.model,
+                messages=[
+                    {"role": "system", "content": self._instruction()},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3
+            )
+            return response.choices[0].message.content.strip()
+
+        response = await client.messages.create(
+            model=self.config.model,
+            max_tokens=4096,
+            messages=[
+                {"role": "user", "content": f"{self._instruction()}\n\n{prompt}"}
+            ],
+            temperature=0.3
+        )
+        return response.content[0].text.strip()
+
     def _build_translation_prompt(self, text: str, context: Optional[str] = None) -> str:
         """Build translation prompt with optional context"""
         if context and self.config.context_aware:
@@ -161,20 +299,53 @@ class Translator:
         Returns:
             Translated text
         """
+        key = self._cache_key(text, context)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
         self._ensure_client()
 
-        logger.debug(f"Translating text: {text[:50]}...")
+        logger.debug("Translating text: %.50s...", text)
 
         if self.config.provider == "openai":
-            return self._translate_with_openai(text, context)
+            result = self._translate_with_openai(text, context)
         elif self.config.provider == "anthropic":
-            return self._translate_with_anthropic(text, context)
+            result = self._translate_with_anthropic(text, context)
         else:
             raise ValueError(f"Unsupported provider: {self.config.provider}")
 
+        self._cache_put(key, result)
+        return result
+
+    def _cache_key(self, text: str, context: Optional[str]) -> Optional[tuple]:
+        """Cache key for a request, or None if the prompt carries context"""
+        if context and self.config.context_aware:
+            return None
+        return (text, self.config.target_language, self.config.model)
+
+    def _cache_put(self, key: Optional[tuple], result: str):
+        """Store a translation, evicting the oldest entry when full"""
+        if key is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > TRANSLATION_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+
+    def cache_clear(self):
+        """Discard all cached translations"""
+        with self._cache_lock:
+            self._cache.clear()
+
     def translate_segments(self, segments: List[Dict]) -> List[Dict]:
         """
-        Translate all segments with context awareness
+        Translate all segments
+
+        With context_aware enabled, segments are translated one after another so
+        each request sees the preceding translations. Otherwise segments are
+        translated concurrently (bounded by config.concurrency).
 
         Args:
             segments: List of transcription segments
@@ -182,35 +353,81 @@ class Translator:
         Returns:
             List of translated segments
         """
-        self._ensure_client()
-
         logger.info(f"Translating {len(segments)} segments to {self.config.target_language}")
 
+        if self.config.context_aware:
+            translated_segments = self._translate_segments_serial(segments)
+        else:
+            translated_segments = asyncio.run(self._atranslate_segments(segments))
+
+        logger.info(f"Translation complete: {len(translated_segments)} segments translated")
+        return translated_segments
+
+    def _translate_segments_serial(self, segments: List[Dict]) -> List[Dict]:
+        """Translate segments in order, feeding previous translations as context"""
+        self._ensure_client()
+
         translated_segments = []
-        context = ""
+        # Recent translations, trimmed to roughly the last 500 characters
+        context = deque()
+        context_len = 0
 
         for idx, segment in enumerate(segments, 1):
             original_text = segment['text'].strip()
 
             # Translate with context
-            translated_text = self.translate_text(original_text, context if self.config.context_aware else None)
+            translated_text = self.translate_text(original_text, "\n".join(context))
 
             # Update context for next segment
-            if self.config.context_aware:
-                context = f"{context}\n{translated_text}"[-500:]  # Keep last 500 chars
-
-            # Create translated segment
-            translated_segment = segment.copy()
-            translated_segment['text'] = translated_text
-            translated_segment['original_text'] = original_text
+            context.append(translated_text)
+            context_len += len(translated_text) + 1
+            while context_len > 500 and context:
+                context_len -= len(context.popleft()) + 1
 
-            translated_segments.append(translated_segment)
+            translated_segments.append(self._make_translated_segment(segment, original_text, translated_text))
 
-            logger.debug(f"Translated segment {idx}/{len(segments)}: {original_text[:30]}... -> {translated_text[:30]}...")
+            logger.debug("Translated segment %d/%d: %.30s... -> %.30s...", idx, len(segments), original_text, translated_text)
 
-        logger.info(f"Translation complete: {len(translated_segments)} segments translated")
         return translated_segments
 
+    async def _atranslate_segments(self, segments: List[Dict]) -> List[Dict]:
+        """Translate segments concurrently, preserving their order"""
+        client = self._create_async_client()
+        sem = asyncio.Semaphore(max(1, self.config.concurrency))
+        # Requests started this run, so repeated lines wait on the first instead
+        # of each missing the cache while it is still empty
+        in_flight: Dict[tuple, asyncio.Task] = {}
+
+        async def fetch(key: tuple, text: str) -> str:
+            async with sem:
+                translated_text = await self._atranslate(client, text)
+            self._cache_put(key, translated_text)
+            return translated_text
+
+        async def one(segment: Dict) -> Dict:
+            original_text = segment['text'].strip()
+            key = self._cache_key(original_text, None)
+            translated_text = self._cache.get(key)
+            if translated_text is None:
+                task = in_flight.get(key)
+                if task is None:
+                    task = in_flight[key] = asyncio.ensure_future(fetch(key, original_text))
+                translated_text = await task
+            return self._make_translated_segment(segment, original_text, translated_text)
+
+        try:
+            return list(await asyncio.gather(*(one(segment) for segment in segments)))
+        finally:
+            await client.close()
+
+    @staticmethod
+    def _make_translated_segment(segment: Dict, original_text: str, translated_text: str) -> Dict:
+        """Copy a segment, replacing its text with the translation"""
+        translated_segment = segment.copy()
+        translated_segment['text'] = translated_text
+        translated_segment['original_text'] = original_text
+        return translated_segment
+
     def translate_batch(self, segments: List[Dict], batch_size: int = 10) -> List[Dict]:
         """
         Translate segments in batches for efficiency
@@ -228,28 +445,26 @@ class Translator:
 
         for i in range(0, len(segments), batch_size):
             batch = segments[i:i + batch_size]
+            batch_texts = [seg['text'].strip() for seg in batch]
 
             # Combine batch texts
-            combined_text = "\n\n".join([f"[{j+1}] {seg['text'].strip()}" for j, seg in enumerate(batch)])
+            combined_text = "\n\n".join(f"[{j}] {text}" for j, text in enumerate(batch_texts, 1))
 
             # Translate batch
             translated_text = self.translate_text(combined_text)
 
-            # Split translated text back into segments
-            translated_lines = translated_text.split("\n\n")
-
-            for j, segment in enumerate(batch):
-                # Try to extract translated text for this segment
-                if j < len(translated_lines):
-                    # Remove segment number if present
-                    translated = translated_lines[j]
-                    if translated.startswith(f"[{j+1}]"):
-                        translated = translated[len(f"[{j+1}]"):].strip()
-
-                    translated_segment = segment.copy()
-                    translated_segment['text'] = translated
-                    translated_segment['original_text'] = segment['text'].strip()
-                    translated_segments.append(translated_segment)
+            # Split translated text back into segments by their [n] markers
+            translations: List[Optional[str]] = [None] * len(batch)
+            for chunk in _BATCH_SPLIT.split(translated_text):
+                match = _BATCH_PREFIX.match(chunk)
+                if match:
+                    idx = int(match.group(1)) - 1
+                    if 0 <= idx < len(batch):
+                        translations[idx] = chunk[match.end():].strip()
+
+            for segment, original_text, translated in zip(batch, batch_texts, translations):
+                if translated is not None:
+                    translated_segments.append(self._make_translated_segment(segment, original_text, translated))
                 else:
                     # Fallback: keep original
                     translated_segments.append(segment)
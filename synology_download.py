@@ -4,125 +4,719 @@ Synology Share Downloader
 Downloads files from Synology NAS sharing links
 """
 
-import urllib.request
+import argparse
+import http.client
+import urllib.error
 import urllib.parse
+import urllib.request
 import json
+import re
 import sys
 import os
+import shutil
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Bytes handed to each read()/write() when streaming the download; reads
+# beyond ~100-200 KiB no longer improve throughput on most links
+CHUNK_SIZE = 256 * 1024
+
+# Read sizes timed at the start of a stream when no size is given, the bytes
+# read with each (after as many again to warm up) and the turns they take
+CHUNK_CANDIDATES = (CHUNK_SIZE, 1024 * 1024)
+PROBE_BYTES = 4 * 1024 * 1024
+PROBE_ROUNDS = 4
+
+# Minimum seconds between progress line updates (~10 Hz)
+PROGRESS_INTERVAL = 0.1
+
+PROGRESS_TEMPLATE = "\r   Progress: {:.1f}% ({:.2f} GB / {:.2f} GB)"
+
+# Written bytes between fdatasync calls, bounding writeback stalls and data loss on crash
+SYNC_INTERVAL = 64 * 1024 * 1024
+
+# Sidecar recording durable progress of a partial download
+PROGRESS_SUFFIX = '.progress'
+
+# Concurrent Range GETs used for fresh downloads when the server supports them
+PARALLEL_CONNECTIONS = 4
+
+# Smaller files are fetched over a single connection
+PARALLEL_MIN_SIZE = 64 * 1024 * 1024
+
+REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+# Probe handling: statuses followed via Location, the most hops taken, and
+# statuses meaning HEAD isn't allowed (retried as a GET)
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+HEAD_UNSUPPORTED = (405, 501)
+
+# Fields read from the share session response
+SHARE_FIELDS = ("filename", "sharing_status")
+_JSON_BLOB_RE = re.compile(r'\{.*\}', re.DOTALL)
+_SHARE_FIELD_RE = re.compile(r'"(filename|sharing_status)"\s*:\s*"([^"]+)"')
+SHARE_MARKER = b"SYNO.SDS.ExtraSession"
+
+# Bytes read per call while scanning for the start of the share object
+SHARE_READ_SIZE = 64 * 1024
+
+
+class ProgressWriter:
+    """File wrapper that counts written bytes and prints throttled progress"""
+
+    def __init__(self, f, total_size, downloaded=0):
+        self.f = f
+        self.total_size = total_size
+        self.downloaded = downloaded
+        self.last_print = 0.0
+        self.lock = threading.Lock()
+        # Redrawing a progress line only makes sense on a terminal
+        self.show_progress = sys.stdout.isatty()
+
+    def write(self, data):
+        n = self.f.write(data)
+        self.update(len(data))
+        return n
+
+    def update(self, nbytes):
+        """Record nbytes written (safe to call from several threads)"""
+        with self.lock:
+            self.downloaded += nbytes
+            if not self.show_progress:
+                return
+
+            now = time.monotonic()
+            if now - self.last_print > PROGRESS_INTERVAL or self.downloaded >= self.total_size:
+                self.last_print = now
+                self.print_progress()
+
+    def print_progress(self):
+        print(PROGRESS_TEMPLATE.format(
+            self.downloaded * 100 / self.total_size,
+            self.downloaded / (1024**3),
+            self.total_size / (1024**3)
+        ), end='', flush=True)
+
+
+class FdWriter:
+    """
+    Minimal writable file over a raw OS descriptor
+
+    Chunks from the network are already large, so writing them straight to the
+    descriptor skips the extra copy through Python's BufferedWriter.
+    """
+
+    def __init__(self, path, flags, offset=0, on_sync=None):
+        self.fd = os.open(path, flags, 0o644)
+        self.offset = offset
+        self.unsynced = 0
+        self.on_sync = on_sync
+        if offset:
+            os.lseek(self.fd, offset, os.SEEK_SET)
+        advise_sequential(self.fd)
+
+    def write(self, data):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.fd, view):]
+        self.offset += len(data)
+
+        # Push dirty pages out steadily rather than all at close()
+        self.unsynced += len(data)
+        if self.unsynced >= SYNC_INTERVAL:
+            self.sync()
+        return len(data)
+
+    def sync(self):
+        """Flush written data to disk and report the durable offset"""
+        datasync(self.fd)
+        self.unsynced = 0
+        if self.on_sync is not None:
+            self.on_sync(self.offset)
+
+    def close(self):
+        try:
+            self.sync()
+        finally:
+            os.close(self.fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class DownloadProgress:
+    """
+    Sidecar file recording how much of a partial download is safely on disk
+
+    Preallocation gives the output file its final size up front, so its size
+    says nothing about progress. Instead the contiguous byte count is saved to
+    <output>.progress after every sync, along with the server's validator
+    (ETag or Last-Modified) so a resume can send If-Range.
+    """
+
+    def __init__(self, output_path, validator=None):
+        self.path = output_path + PROGRESS_SUFFIX
+        self.validator = validator
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Return (offset, validator) from a previous run, or (0, None)"""
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+            return int(state["offset"]), state.get("validator")
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0, None
+
+    def save(self, offset):
+        with self.lock:
+            tmp = self.path + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump({"offset": offset, "validator": self.validator}, f)
+            os.replace(tmp, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def datasync(fd):
+    """Flush written data for fd to disk"""
+    if hasattr(os, 'fdatasync'):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+
+def advise_sequential(fd):
+    """Hint the kernel that fd is written front to back (best effort)"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
 
-def download_from_synology_share(share_id, output_path, nas_ip="192.168.1.200", port=5000):
-    """Download file from Synology sharing link"""
+
+def parse_share_info(content):
+    """Extract filename and sharing_status from a share session response"""
+    blob = _JSON_BLOB_RE.search(content)
+    if blob:
+        try:
+            data = json.loads(blob.group(0))
+            if isinstance(data, dict) and "filename" in data:
+                return {key: data.get(key) for key in SHARE_FIELDS}
+        except ValueError:
+            pass
+
+    # Not plain JSON (or fields are nested): pick both fields out in one scan
+    info = {}
+    for match in _SHARE_FIELD_RE.finditer(content):
+        info.setdefault(match.group(1), match.group(2))
+    return info
+
+
+class ShareStream:
+    """
+    File-like view of a share response starting at its first '{'
+
+    Only the JavaScript before the object is buffered (in header); the object
+    itself is handed to the parser as it arrives.
+    """
+
+    def __init__(self, response):
+        self.response = response
+        self.pending = b''
+        self.found = False
+
+        header = bytearray()
+        while True:
+            chunk = response.read(SHARE_READ_SIZE)
+            if not chunk:
+                break
+            start = chunk.find(b'{')
+            if start != -1:
+                header += chunk[:start]
+                self.pending = chunk[start:]
+                self.found = True
+                break
+            header += chunk
+        self.header = bytes(header)
+
+    def read(self, n=-1):
+        # ijson probes with read(0) to learn whether the stream yields bytes
+        if self.pending and n != 0:
+            data, self.pending = self.pending, b''
+            return data
+        return self.response.read(n)
+
+
+def stream_share_fields(stream):
+    """Pick the top-level share fields out of stream, stopping once all are seen"""
+    info = {}
+    try:
+        for prefix, event, value in ijson.parse(stream):
+            if prefix in SHARE_FIELDS and event == 'string':
+                info[prefix] = value
+                if len(info) == len(SHARE_FIELDS):
+                    break
+    except ijson.JSONError:
+        # e.g. the ';' after the object, or JavaScript rather than JSON
+        pass
+    return info
+
+
+def read_share_info(conn, path):
+    """
+    Request a share session response and read filename and sharing_status
+
+    With ijson installed the object is stream-parsed and reading stops once
+    both fields are seen, so memory stays bounded however large the response
+    is. If that finds no filename (the object isn't plain JSON, or the fields
+    are nested), the response is requested again and parsed whole with
+    parse_share_info, as it always is without ijson.
+
+    Returns:
+        Dict of the fields found, or None if this is not a session response
+    """
+    conn.request('GET', path, headers=REQUEST_HEADERS)
+    response = conn.getresponse()
+
+    if ijson is not None:
+        stream = ShareStream(response)
+        if not stream.found:
+            # No object at all, so the header is the whole body
+            content = stream.header.decode()
+            return parse_share_info(content) if SHARE_MARKER.decode() in content else None
+
+        info = stream_share_fields(stream) if SHARE_MARKER in stream.header else {}
+
+        # Stopped reading mid-body, so the connection can't carry another request
+        if not response.isclosed():
+            conn.close()
+        if "filename" in info:
+            return info
+
+        conn.request('GET', path, headers=REQUEST_HEADERS)
+        response = conn.getresponse()
+
+    content = response.read().decode()
+    if SHARE_MARKER.decode() not in content:
+        return None
+    return parse_share_info(content)
+
+
+def preallocate(fd, size):
+    """Reserve disk space for the whole file up front (best effort)"""
+    if not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        # Not supported by this filesystem; blocks are allocated as we write
+        pass
+
+
+def probe_chunk_size(response, writer):
+    """
+    Copy the start of response while timing each candidate read size
+
+    The first PROBE_BYTES are copied untimed so TCP slow start doesn't count
+    against whichever size goes first. The candidates then copy PROBE_BYTES
+    each, in PROBE_ROUNDS turns whose order alternates, so both see the same
+    link conditions.
+
+    Returns:
+        The read size that sustained the highest throughput (CHUNK_SIZE if
+        the stream ends during the probe)
+    """
+    def copy(size, limit):
+        copied = 0
+        while copied < limit:
+            chunk = response.read(size)
+            if not chunk:
+                break
+            writer.write(chunk)
+            copied += len(chunk)
+        return copied
+
+    if copy(CHUNK_SIZE, PROBE_BYTES) < PROBE_BYTES:
+        return CHUNK_SIZE
+
+    turn = PROBE_BYTES // PROBE_ROUNDS
+    elapsed = dict.fromkeys(CHUNK_CANDIDATES, 0.0)
+    order = list(CHUNK_CANDIDATES)
+    for _ in range(PROBE_ROUNDS):
+        for size in order:
+            start = time.perf_counter()
+            if copy(size, turn) < turn:
+                return CHUNK_SIZE
+            elapsed[size] += time.perf_counter() - start
+        order.reverse()
+
+    # Every candidate copied the same number of bytes, so least time wins
+    return min(CHUNK_CANDIDATES, key=elapsed.get)
+
+
+def copy_response(response, writer, chunk_size=None):
+    """Copy response into writer, autotuning the read size if chunk_size is None"""
+    if chunk_size is None:
+        chunk_size = probe_chunk_size(response, writer)
+    shutil.copyfileobj(response, writer, chunk_size)
+
+
+def download_stream(response, output_path, total_size, progress, chunk_size=None, offset=0):
+    """Stream an open response into output_path, starting at byte offset"""
+    flags = os.O_WRONLY | os.O_CREAT | (0 if offset else os.O_TRUNC)
+    with FdWriter(output_path, flags, offset, on_sync=progress.save) as f:
+        preallocate(f.fd, total_size)
+        writer = ProgressWriter(f, total_size, offset)
+        try:
+            copy_response(response, writer, chunk_size)
+        finally:
+            # Drop any preallocated (or stale) tail that was never written
+            os.ftruncate(f.fd, writer.downloaded)
+
+    # A dropped connection just ends the body early; keep the sidecar for a resume
+    if writer.downloaded != total_size:
+        raise IOError(f"Download incomplete: got {writer.downloaded:,} of {total_size:,} bytes")
+
+
+def open_range(url, start, end=None, validator=None):
+    """
+    Open url for bytes start..end (inclusive; end=None reads to EOF)
+
+    With a validator, If-Range is sent too; a 200 reply then means the file
+    changed on the server and carries the whole new body.
+    """
+    req = urllib.request.Request(url, headers=REQUEST_HEADERS)
+    req.add_header('Range', f"bytes={start}-{'' if end is None else end}")
+    if validator:
+        req.add_header('If-Range', validator)
+
+    response = urllib.request.urlopen(req, timeout=10)
+    if response.status != 206 and not (validator and response.status == 200):
+        response.close()
+        raise IOError(f"Server ignored Range request (HTTP {response.status})")
+    return response
+
+
+def resume_download(url, output_path, offset, total_size, progress, validator, chunk_size=None):
+    """Continue a partial download from offset, starting over if the file changed"""
+    with open_range(url, offset, validator=validator) as response:
+        if response.status == 200:
+            print("   File changed on server, starting over")
+            offset = 0
+        download_stream(response, output_path, total_size, progress, chunk_size, offset)
+
+
+def contiguous_prefix(ranges, written):
+    """Bytes from the start of the file covered by fully written ranges plus the first partial one"""
+    prefix = 0
+    for (start, end), n in zip(ranges, written):
+        prefix += n
+        if n != end - start + 1:
+            break
+    return prefix
+
+
+def download_ranges(url, output_path, total_size, progress, connections=PARALLEL_CONNECTIONS, chunk_size=None):
+    """
+    Download a file as several concurrent Range requests
+
+    Each connection writes its slice in place with os.pwrite, syncing the file
+    and recording the contiguous written prefix in progress every
+    SYNC_INTERVAL bytes. If any slice fails (or the download is interrupted)
+    the others are cancelled and the prefix is synced and recorded once more,
+    so a later run can resume from there.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    part = -(-total_size // connections)
+    ranges = [(start, min(start + part, total_size) - 1) for start in range(0, total_size, part)]
+    written = [0] * len(ranges)
+    meter = ProgressWriter(None, total_size)
+    cancelled = threading.Event()
+    sync_lock = threading.Lock()
+
+    def sync():
+        # fdatasync covers every range's writes, so the prefix read beforehand is durable
+        with sync_lock:
+            prefix = contiguous_prefix(ranges, written)
+            datasync(fd)
+            progress.save(prefix)
+
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        preallocate(fd, total_size)
+
+        def fetch(i):
+            start, end = ranges[i]
+            unsynced = 0
+            with open_range(url, start, end) as response:
+                while not cancelled.is_set():
+                    chunk = response.read(chunk_size)
+                    if not chunk:
+                        break
+                    os.pwrite(fd, chunk, start + written[i])
+                    written[i] += len(chunk)
+                    meter.update(len(chunk))
+
+                    unsynced += len(chunk)
+                    if unsynced >= SYNC_INTERVAL:
+                        sync()
+                        unsynced = 0
+            if written[i] != end - start + 1:
+                raise IOError(f"Incomplete range {start}-{end}")
+
+        executor = ThreadPoolExecutor(max_workers=len(ranges))
+        futures = [executor.submit(fetch, i) for i in range(len(ranges))]
+        try:
+            wait(futures, return_when=FIRST_EXCEPTION)
+        finally:
+            # On error or Ctrl-C, stop the remaining ranges at their next chunk
+            cancelled.set()
+            executor.shutdown(wait=True)
+
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            raise errors[0]
+    finally:
+        prefix = contiguous_prefix(ranges, written)
+        if prefix != total_size:
+            os.ftruncate(fd, prefix)
+        try:
+            sync()
+        finally:
+            os.close(fd)
+
+
+def probe_url(url):
+    """
+    Fetch the headers for an absolute URL with urllib (following redirects)
+
+    Returns:
+        (final_url, response) with the response already closed
+    """
+    for method in ('HEAD', 'GET'):
+        req = urllib.request.Request(url, headers=REQUEST_HEADERS, method=method)
+        try:
+            response = urllib.request.urlopen(req, timeout=10)
+        except urllib.error.HTTPError as e:
+            if method == 'HEAD' and e.code in HEAD_UNSUPPORTED:
+                continue
+            raise
+        # Only the headers are needed, even for a GET
+        response.close()
+        return response.url, response
+
+
+def probe(conn, base_url, path):
+    """
+    Fetch the headers for path, following redirects
+
+    Uses HEAD over the keep-alive connection, falling back to a GET when the
+    server rejects HEAD. Redirects that leave the NAS are probed with urllib.
+
+    Returns:
+        (final_url, response) where only the response headers are usable
+    """
+    url = base_url + path
+    for _ in range(MAX_REDIRECTS + 1):
+        if not url.startswith(base_url + '/'):
+            return probe_url(url)
+
+        path = url[len(base_url):]
+        conn.request('HEAD', path, headers=REQUEST_HEADERS)
+        response = conn.getresponse()
+        response.read()
+
+        if response.status in HEAD_UNSUPPORTED:
+            conn.request('GET', path, headers=REQUEST_HEADERS)
+            response = conn.getresponse()
+            # Drop the connection rather than read the whole file
+            conn.close()
+
+        location = response.headers.get('Location')
+        if response.status not in REDIRECT_STATUSES or not location:
+            return url, response
+
+        url = urllib.parse.urljoin(url, location)
+        print(f"   Redirected to: {url}")
+
+    raise IOError(f"Too many redirects (> {MAX_REDIRECTS})")
+
+
+def find_download(conn, base_url, paths):
+    """
+    Probe candidate download paths for one that serves a file
+
+    Returns:
+        (url, content_length, accepts_ranges, validator) for the first path
+        that serves a file, or None if none does. url is the absolute URL
+        after redirects; validator is the ETag (or Last-Modified) value, if any.
+    """
+    for path in paths:
+        print(f"   Trying: {base_url}{path}")
+        try:
+            url, response = probe(conn, base_url, path)
+
+            content_type = response.headers.get('Content-Type', '')
+            total_size = int(response.headers.get('Content-Length', 0))
+
+            if response.status != 200:
+                print(f"   HTTP {response.status} {response.reason}")
+            elif 'application/json' in content_type:
+                print("   API returned JSON, not a file")
+            elif total_size > 0:
+                accepts_ranges = response.headers.get('Accept-Ranges', '') == 'bytes'
+                validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+                return url, total_size, accepts_ranges, validator
+
+        except Exception as e:
+            print(f"   Error: {e}")
+            # Reconnect on the next request
+            conn.close()
+
+    return None
+
+
+def open_download(conn, base_url, url):
+    """GET url, over the keep-alive connection when it is on the NAS itself"""
+    if not url.startswith(base_url + '/'):
+        req = urllib.request.Request(url, headers=REQUEST_HEADERS)
+        return urllib.request.urlopen(req, timeout=10)
+
+    conn.request('GET', url[len(base_url):], headers=REQUEST_HEADERS)
+    response = conn.getresponse()
+    if response.status != 200:
+        raise IOError(f"HTTP {response.status} {response.reason}")
+    return response
+
+
+def download_from_synology_share(share_id, output_path, nas_ip="192.168.1.200", port=5000, chunk_size=None):
+    """Download file from Synology sharing link (chunk_size=None autotunes the read size)"""
 
     base_url = f"http://{nas_ip}:{port}"
 
     print(f"Attempting to download from share: {share_id}")
     print(f"NAS: {base_url}")
 
-    # Step 1: Get share info
-    session_url = f"{base_url}/webapi/entry.cgi?api=SYNO.Core.Sharing.Session&version=1&method=get&sharing_id={share_id}"
+    # One keep-alive connection serves the share lookup, the HEAD probes and
+    # the download itself
+    conn = http.client.HTTPConnection(nas_ip, port, timeout=10)
+    try:
+        if not fetch_share_info(conn, share_id):
+            return False
+        return download_share_file(conn, base_url, share_id, output_path, chunk_size)
+    finally:
+        conn.close()
+
+
+def fetch_share_info(conn, share_id):
+    """Step 1: check the share exists and is not password protected"""
+    session_path = f"/webapi/entry.cgi?api=SYNO.Core.Sharing.Session&version=1&method=get&sharing_id={share_id}"
 
     try:
         print("\n[1/3] Getting share information...")
-        req = urllib.request.Request(session_url)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            content = response.read().decode()
-
-            # Parse JavaScript response
-            if "SYNO.SDS.ExtraSession" in content:
-                # Extract filename from JavaScript object
-                import re
-                match = re.search(r'"filename"\s*:\s*"([^"]+)"', content)
-                if match:
-                    filename = match.group(1)
-                    print(f"   Found file: {filename}")
-                else:
-                    print("   Error: Could not extract filename")
-                    return False
-
-                # Check if password protected
-                status_match = re.search(r'"sharing_status"\s*:\s*"([^"]+)"', content)
-                if status_match and status_match.group(1) != "none":
-                    print(f"   Error: Share is password protected (status: {status_match.group(1)})")
-                    return False
-            else:
-                print("   Error: Invalid share response")
-                return False
+        info = read_share_info(conn, session_path)
+
+        # Parse JavaScript response
+        if info is None:
+            print("   Error: Invalid share response")
+            return False
+
+        # Extract filename from JavaScript object
+        filename = info.get("filename")
+        if filename:
+            print(f"   Found file: {filename}")
+        else:
+            print("   Error: Could not extract filename")
+            return False
+
+        # Check if password protected
+        status = info.get("sharing_status")
+        if status and status != "none":
+            print(f"   Error: Share is password protected (status: {status})")
+            return False
 
     except Exception as e:
         print(f"   Error: {e}")
+        # Reconnect on the next request
+        conn.close()
         return False
 
+    return True
+
+
+def download_share_file(conn, base_url, share_id, output_path, chunk_size=None):
+    """Steps 2-3: locate the download endpoint and fetch the file"""
     # Step 2: Try download endpoint
     print("\n[2/3] Attempting download...")
 
-    download_urls = [
-        f"{base_url}/fbdownload/{share_id}",
-        f"{base_url}/sharing/{share_id}/download",
-        f"{base_url}/webapi/entry.cgi?api=SYNO.FileStation.Download&version=1&method=download&sharing_id={share_id}",
+    download_paths = [
+        f"/fbdownload/{share_id}",
+        f"/sharing/{share_id}/download",
+        f"/webapi/entry.cgi?api=SYNO.FileStation.Download&version=1&method=download&sharing_id={share_id}",
     ]
 
-    for download_url in download_urls:
-        try:
-            print(f"   Trying: {download_url}")
-
-            req = urllib.request.Request(download_url)
-            req.add_header('User-Agent', 'Mozilla/5.0')
-
-            with urllib.request.urlopen(req, timeout=10) as response:
-                # Check if this is actually a file download
-                content_type = response.headers.get('Content-Type', '')
-
-                if 'application/json' in content_type:
-                    data = response.read().decode()
-                    print(f"   API Response: {data[:200]}")
-                    continue
-
-                # Looks like a file!
-                total_size = int(response.headers.get('Content-Length', 0))
-                if total_size > 0:
-                    size_gb = total_size / (1024**3)
-                    print(f"\n   File size: {size_gb:.2f} GB ({total_size:,} bytes)")
-
-                    # Check disk space
-                    import shutil
-                    stat = shutil.disk_usage(os.path.dirname(output_path))
-                    free_gb = stat.free / (1024**3)
-
-                    print(f"   Available space: {free_gb:.2f} GB")
-
-                    if total_size > stat.free * 0.9:
-                        print(f"\n   ⚠️  WARNING: Not enough disk space!")
-                        print(f"   Need: {size_gb:.2f} GB, Available: {free_gb:.2f} GB")
-                        response = input("\n   Continue anyway? (yes/no): ")
-                        if response.lower() != 'yes':
-                            print("   Download cancelled.")
-                            return False
+    try:
+        found = find_download(conn, base_url, download_paths)
+        if found is not None:
+            download_url, total_size, accepts_ranges, validator = found
 
-                    # Download with progress
-                    print(f"\n[3/3] Downloading to: {output_path}")
+            size_gb = total_size / (1024**3)
+            print(f"\n   File size: {size_gb:.2f} GB ({total_size:,} bytes)")
 
-                    with open(output_path, 'wb') as f:
-                        downloaded = 0
-                        chunk_size = 1024 * 1024  # 1MB chunks
+            # Check disk space
+            stat = shutil.disk_usage(os.path.dirname(output_path))
+            free_gb = stat.free / (1024**3)
 
-                        while True:
-                            chunk = response.read(chunk_size)
-                            if not chunk:
-                                break
+            print(f"   Available space: {free_gb:.2f} GB")
 
-                            f.write(chunk)
-                            downloaded += len(chunk)
+            if total_size > stat.free * 0.9:
+                print(f"\n   ⚠️  WARNING: Not enough disk space!")
+                print(f"   Need: {size_gb:.2f} GB, Available: {free_gb:.2f} GB")
+                answer = input("\n   Continue anyway? (yes/no): ")
+                if answer.lower() != 'yes':
+                    print("   Download cancelled.")
+                    return False
 
-                            if total_size > 0:
-                                percent = (downloaded / total_size) * 100
-                                print(f"\r   Progress: {percent:.1f}% ({downloaded/(1024**3):.2f} GB / {size_gb:.2f} GB)", end='', flush=True)
+            # Download with progress
+            print(f"\n[3/3] Downloading to: {output_path}")
+
+            # Only a progress sidecar from an earlier run marks the file as partial
+            progress = DownloadProgress(output_path, validator)
+            offset, saved_validator = progress.load()
+            if not os.path.exists(output_path):
+                offset = 0
+
+            if accepts_ranges and 0 < offset < total_size:
+                print(f"   Resuming from {offset/(1024**3):.2f} GB")
+                resume_download(download_url, output_path, offset, total_size, progress, saved_validator, chunk_size)
+            elif accepts_ranges and hasattr(os, 'pwrite') and total_size >= PARALLEL_MIN_SIZE:
+                print(f"   Using {PARALLEL_CONNECTIONS} parallel connections")
+                download_ranges(download_url, output_path, total_size, progress, chunk_size=chunk_size)
+            else:
+                response = open_download(conn, base_url, download_url)
+                download_stream(response, output_path, total_size, progress, chunk_size)
 
-                    print("\n\n✓ Download complete!")
-                    return True
+            progress.clear()
+            print("\n\n✓ Download complete!")
+            return True
 
-        except Exception as e:
-            print(f"   Error: {e}")
-            continue
+    except Exception as e:
+        print(f"   Error: {e}")
 
     print("\n✗ All download methods failed.")
     print("\nPlease download manually:")
@@ -133,7 +727,21 @@ def download_from_synology_share(share_id, output_path, nas_ip="192.168.1.200",
     return False
 
 
+def positive_int(value):
+    """argparse type accepting integers greater than zero"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download a file from a Synology sharing link")
+    parser.add_argument('--chunk-size', type=positive_int, metavar='KIB',
+                        help=f'Read size in KiB (default: pick {CHUNK_SIZE // 1024} KiB or 1 MiB from a short probe)')
+    args = parser.parse_args()
+    chunk_size = args.chunk_size * 1024 if args.chunk_size else None
+
     share_id = "0FzZVYtsg"
     output_path = "/home/peter/work/whisparr/test_media/The_King_2019.mkv"
 
@@ -141,7 +749,7 @@ if __name__ == "__main__":
     print("Synology Share Downloader")
     print("=" * 60)
 
-    success = download_from_synology_share(share_id, output_path)
+    success = download_from_synology_share(share_id, output_path, chunk_size=chunk_size)
 
     if success:
         print(f"\nFile saved to: {output_path}")
@@ -2,42 +2,55 @@
 Tests for config_loader module
 """
 
+import os
+import copy
 import pytest
 import json
 from pathlib import Path
 from src.config_loader import Config
 
 
+@pytest.fixture(scope="module")
+def default_config_dict():
+    """Default configuration, built once per module"""
+    return copy.deepcopy(Config().to_dict())
+
+
+@pytest.fixture
+def config(default_config_dict):
+    """Fresh Config populated from a copy of the cached defaults"""
+    c = Config.__new__(Config)
+    c.config_path = None
+    c.config = copy.deepcopy(default_config_dict)
+    c._cache = {}
+    return c
+
+
 class TestConfig:
     """Test cases for Config class"""
 
-    def test_default_config(self):
+    def test_default_config(self, config):
         """Test default configuration is loaded"""
-        config = Config()
         assert config.get("whisper.model_size") == "base"
         assert config.get("subtitle.format") == "srt"
         assert config.get("logging.level") == "INFO"
 
-    def test_get_nested_value(self):
+    def test_get_nested_value(self, config):
         """Test getting nested configuration values"""
-        config = Config()
         assert config.get("whisper.model_size") == "base"
         assert config.get("subtitle.max_line_length") == 42
 
-    def test_get_with_default(self):
+    def test_get_with_default(self, config):
         """Test getting value with default fallback"""
-        config = Config()
         assert config.get("nonexistent.key", "default") == "default"
 
-    def test_set_value(self):
+    def test_set_value(self, config):
         """Test setting configuration values"""
-        config = Config()
         config.set("whisper.model_size", "medium")
         assert config.get("whisper.model_size") == "medium"
 
-    def test_set_new_nested_value(self):
+    def test_set_new_nested_value(self, config):
         """Test setting a new nested value"""
-        config = Config()
         config.set("new.nested.value", 123)
         assert config.get("new.nested.value") == 123
 
@@ -57,9 +70,22 @@ class TestConfig:
         # Check that defaults are still present
         assert config.get("subtitle.format") == "srt"
 
-    def test_save_config(self, tmp_path):
+    def test_load_config_reparses_modified_file(self, tmp_path):
+        """Test cached parses are isolated per instance and refreshed on change"""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"whisper": {"model_size": "large"}}))
+
+        first = Config(str(config_path))
+        first.set("whisper.model_size", "tiny")
+        assert Config(str(config_path)).get("whisper.model_size") == "large"
+
+        config_path.write_text(json.dumps({"whisper": {"model_size": "small"}}))
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert Config(str(config_path)).get("whisper.model_size") == "small"
+
+    def test_save_config(self, config, tmp_path):
         """Test saving configuration to file"""
-        config = Config()
         config.set("whisper.model_size", "small")
 
         output_path = tmp_path / "output.json"
@@ -71,9 +97,8 @@ class TestConfig:
             saved_config = json.load(f)
         assert saved_config["whisper"]["model_size"] == "small"
 
-    def test_to_dict(self):
+    def test_to_dict(self, config):
         """Test converting config to dictionary"""
-        config = Config()
         config_dict = config.to_dict()
         assert isinstance(config_dict, dict)
         assert "whisper" in config_dict
@@ -0,0 +1,159 @@
+"""
+Tests for processor module
+"""
+
+import os
+import pytest
+from src.config_loader import Config
+from src.processor import FileProcessor, _iter_media_files
+
+
+SEGMENTS = [{"start": 0.0, "end": 1.5, "text": "Hello"}]
+
+
+@pytest.fixture
+def make_processor():
+    """Build a FileProcessor whose transcriber records calls instead of running Whisper"""
+    def make(**overrides):
+        config = Config()
+        for key, value in overrides.items():
+            config.set(key, value)
+
+        processor = FileProcessor(config)
+        processor.calls = []
+
+        def transcribe(path):
+            processor.calls.append(path)
+            return {"segments": SEGMENTS}
+
+        processor.transcriber.transcribe = transcribe
+        return processor
+    return make
+
+
+@pytest.fixture
+def transcribed(tmp_path):
+    """A media file whose subtitle was written after it"""
+    media = tmp_path / "movie.mp4"
+    media.write_bytes(b"\0" * 2048)
+    subtitle = tmp_path / "movie.srt"
+    subtitle.write_text("old")
+    os.utime(media, (1000, 1000))
+    os.utime(subtitle, (2000, 2000))
+    return media, subtitle
+
+
+class TestSkipIfNewer:
+    """Interaction of overwrite_existing and skip_if_newer"""
+
+    def test_overwrite_skips_up_to_date_subtitle(self, make_processor, transcribed):
+        """Overwriting still skips subtitles newer than their source"""
+        media, subtitle = transcribed
+        processor = make_processor(**{
+            "processing.overwrite_existing": True,
+            "processing.skip_if_newer": True,
+        })
+
+        assert processor.process_file(str(media)) == str(subtitle)
+        assert processor.calls == []
+        assert subtitle.read_text() == "old"
+
+    def test_overwrite_without_skip_regenerates(self, make_processor, transcribed):
+        """With skip_if_newer off, overwriting regenerates every subtitle"""
+        media, subtitle = transcribed
+        processor = make_processor(**{
+            "processing.overwrite_existing": True,
+            "processing.skip_if_newer": False,
+        })
+
+        processor.process_file(str(media))
+        assert processor.calls == [str(media)]
+        assert "Hello" in subtitle.read_text()
+
+    def test_overwrite_regenerates_stale_subtitle(self, make_processor, transcribed):
+        """A source modified after its subtitle is re-processed"""
+        media, subtitle = transcribed
+        os.utime(media, (3000, 3000))
+        processor = make_processor(**{"processing.overwrite_existing": True})
+
+        processor.process_file(str(media))
+        assert processor.calls == [str(media)]
+
+
+class TestProcessDirectory:
+    """Directory walking and output layout"""
+
+    def test_accepts_path_objects(self, make_processor, tmp_path):
+        """Path arguments work as well as strings, and the tree is mirrored"""
+        (tmp_path / "in" / "season1").mkdir(parents=True)
+        (tmp_path / "in" / "season1" / "ep1.mkv").write_bytes(b"\0" * 2048)
+        processor = make_processor()
+
+        generated = processor.process_directory(tmp_path / "in", tmp_path / "out", recursive=True)
+
+        assert generated == [str(tmp_path / "out" / "season1" / "ep1.srt")]
+
+    def test_skips_undersized_files(self, make_processor, tmp_path):
+        """Files below processing.min_size_bytes are never transcribed"""
+        (tmp_path / "empty.mp4").write_bytes(b"")
+        (tmp_path / "truncated.mp4").write_bytes(b"\0" * 99)
+        (tmp_path / "movie.mp4").write_bytes(b"\0" * 100)
+        processor = make_processor(**{"processing.min_size_bytes": 100})
+
+        generated = processor.process_directory(str(tmp_path))
+
+        assert processor.calls == [str(tmp_path / "movie.mp4")]
+        assert generated == [str(tmp_path / "movie.srt")]
+
+
+@pytest.fixture
+def media_tree(tmp_path):
+    """Small library with nested, mixed-case, unsupported and extensionless files"""
+    (tmp_path / "season1" / "extras").mkdir(parents=True)
+    for rel in ("movie.MP4", "notes.txt", "noext", "season1/ep1.mkv", "season1/extras/clip.wav"):
+        (tmp_path / rel).write_bytes(b"\0" * 2048)
+    return tmp_path
+
+
+class TestIterMediaFiles:
+    """Single-pass directory walk"""
+
+    def test_top_level_only(self, media_tree):
+        """Without recursion only the root is scanned; extensions match case-insensitively"""
+        found = _iter_media_files(str(media_tree), frozenset({".mp4", ".mkv", ".wav"}), False)
+        assert sorted(e.name for e in found) == ["movie.MP4"]
+
+    def test_recursive(self, media_tree):
+        """Recursion descends into every subdirectory"""
+        found = _iter_media_files(str(media_tree), frozenset({".mp4", ".mkv", ".wav"}), True)
+        assert sorted(e.name for e in found) == ["clip.wav", "ep1.mkv", "movie.MP4"]
+
+    def test_directory_symlinks_not_followed(self, media_tree):
+        """Symlinked directories are neither descended into nor yielded"""
+        os.symlink(media_tree / "season1", media_tree / "link")
+        found = _iter_media_files(str(media_tree), frozenset({".mkv"}), True)
+        assert [e.path for e in found] == [str(media_tree / "season1" / "ep1.mkv")]
+
+    def test_file_symlinks_followed(self, media_tree):
+        """Symlinked media files are yielded and sized by their target"""
+        os.symlink(media_tree / "season1" / "ep1.mkv", media_tree / "ep1-link.mkv")
+        os.symlink(media_tree / "missing.mkv", media_tree / "broken.mkv")
+        found = list(_iter_media_files(str(media_tree), frozenset({".mkv"}), False))
+
+        assert [e.name for e in found] == ["ep1-link.mkv"]
+        assert found[0].stat().st_size == 2048
+
+    def test_unreadable_directory_skipped(self, media_tree, monkeypatch):
+        """A folder that can't be listed is skipped instead of aborting the walk"""
+        locked = str(media_tree / "season1")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if path == locked:
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        found = _iter_media_files(str(media_tree), frozenset({".mp4", ".mkv", ".wav"}), True)
+
+        assert sorted(e.name for e in found) == ["movie.MP4"]
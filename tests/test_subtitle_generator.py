@@ -2,48 +2,95 @@
 Tests for subtitle_generator module
 """
 
+import sys
 import pytest
 from pathlib import Path
+from src import subtitle_generator
 from src.subtitle_generator import SubtitleGenerator
 
 
+SAMPLE_SEGMENTS = (
+    {
+        "start": 0.0,
+        "end": 2.5,
+        "text": "Hello, this is a test."
+    },
+    {
+        "start": 2.5,
+        "end": 5.0,
+        "text": "This is the second segment."
+    }
+)
+
+TIMESTAMP_CASES = [
+    (0.0, "00:00:00", "000"),
+    (1.5, "00:00:01", "500"),
+    (61.234, "00:01:01", "234"),
+    (3661.0, "01:01:01", "000"),
+]
+
+
+@pytest.fixture(scope="class")
+def generator():
+    """Shared SubtitleGenerator instance"""
+    return SubtitleGenerator()
+
+
 class TestSubtitleGenerator:
     """Test cases for SubtitleGenerator class"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.generator = SubtitleGenerator()
-        self.sample_segments = [
-            {
-                "start": 0.0,
-                "end": 2.5,
-                "text": "Hello, this is a test."
-            },
-            {
-                "start": 2.5,
-                "end": 5.0,
-                "text": "This is the second segment."
-            }
-        ]
-
-    def test_format_timestamp_srt(self):
+    @pytest.mark.parametrize("seconds,hms,millis", TIMESTAMP_CASES)
+    def test_format_timestamp_srt(self, generator, seconds, hms, millis):
         """Test SRT timestamp formatting"""
-        assert self.generator.format_timestamp_srt(0.0) == "00:00:00,000"
-        assert self.generator.format_timestamp_srt(1.5) == "00:00:01,500"
-        assert self.generator.format_timestamp_srt(61.234) == "00:01:01,234"
-        assert self.generator.format_timestamp_srt(3661.0) == "01:01:01,000"
+        assert generator.format_timestamp_srt(seconds) == f"{hms},{millis}"
 
-    def test_format_timestamp_vtt(self):
+    @pytest.mark.parametrize("seconds,hms,millis", TIMESTAMP_CASES)
+    def test_format_timestamp_vtt(self, generator, seconds, hms, millis):
         """Test VTT timestamp formatting"""
-        assert self.generator.format_timestamp_vtt(0.0) == "00:00:00.000"
-        assert self.generator.format_timestamp_vtt(1.5) == "00:00:01.500"
-        assert self.generator.format_timestamp_vtt(61.234) == "00:01:01.234"
-        assert self.generator.format_timestamp_vtt(3661.0) == "01:01:01.000"
+        assert generator.format_timestamp_vtt(seconds) == f"{hms}.{millis}"
+
+    def test_format_timestamps_matches_single(self, generator):
+        """Test batch timestamp formatting agrees with the per-value formatter"""
+        values = [i * 0.137 for i in range(3000)]
+        assert generator._format_timestamps(values, ",") == [
+            generator.format_timestamp_srt(v) for v in values
+        ]
+
+    def test_format_timestamps_rounds_past_fixed_width(self, generator, monkeypatch):
+        """Test values that round up to hour 100 are not squeezed into two digits"""
+        monkeypatch.setattr(subtitle_generator, "JIT_MIN_TIMESTAMPS", 1)
+        assert generator._format_timestamps([359999.9996], ",") == ["100:00:00,000"]
+
+    def test_fill_timestamps_kernel(self, generator):
+        """Test the numba kernel writes the same digits as the Python formatter"""
+        pytest.importorskip("numba")
+        np = pytest.importorskip("numpy")
+
+        values = np.array([0.0, 0.0004, 1.5, 61.234, 3661.0, 359999.9994, 12345.6785])
+        out = np.empty((values.shape[0], 12), dtype=np.uint8)
+        subtitle_generator._get_timestamp_kernel()(values, ord("."), out)
+
+        assert [row.tobytes().decode("ascii") for row in out] == [
+            generator.format_timestamp_vtt(v) for v in values
+        ]
+
+    def test_timestamp_kernel_cached(self):
+        """Test the kernel is compiled once and reused"""
+        pytest.importorskip("numba")
+        assert subtitle_generator._get_timestamp_kernel() is subtitle_generator._get_timestamp_kernel()
+
+    def test_format_timestamps_without_numba(self, generator, monkeypatch):
+        """Test long inputs fall back to the Python formatter when numba is missing"""
+        monkeypatch.setattr(subtitle_generator, "_timestamp_kernel", None)
+        monkeypatch.setitem(sys.modules, "numba", None)
+
+        assert generator._format_timestamps([1.5] * 3000, ",") == ["00:00:01,500"] * 3000
+        assert subtitle_generator._timestamp_kernel is False
 
-    def test_generate_srt(self, tmp_path):
+    def test_generate_srt(self, generator, tmp_path):
         """Test SRT file generation"""
         output_path = tmp_path / "test.srt"
-        result = self.generator.generate_srt(self.sample_segments, str(output_path))
+        result = generator.generate_srt(list(SAMPLE_SEGMENTS), str(output_path))
 
         assert Path(result).exists()
         content = Path(result).read_text()
@@ -51,10 +98,10 @@ class TestSubtitleGenerator:
         assert "00:00:00,000 --> 00:00:02,500" in content
         assert "Hello, this is a test." in content
 
-    def test_generate_vtt(self, tmp_path):
+    def test_generate_vtt(self, generator, tmp_path):
         """Test VTT file generation"""
         output_path = tmp_path / "test.vtt"
-        result = self.generator.generate_vtt(self.sample_segments, str(output_path))
+        result = generator.generate_vtt(list(SAMPLE_SEGMENTS), str(output_path))
 
         assert Path(result).exists()
         content = Path(result).read_text()
@@ -62,8 +109,8 @@ class TestSubtitleGenerator:
         assert "00:00:00.000 --> 00:00:02.500" in content
         assert "Hello, this is a test." in content
 
-    def test_generate_unsupported_format(self, tmp_path):
+    def test_generate_unsupported_format(self, generator, tmp_path):
         """Test error handling for unsupported format"""
         output_path = tmp_path / "test.xyz"
         with pytest.raises(ValueError, match="Unsupported subtitle format"):
-            self.generator.generate(self.sample_segments, str(output_path), format="xyz")
+            generator.generate(list(SAMPLE_SEGMENTS), str(output_path), format="xyz")
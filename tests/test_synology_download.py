@@ -0,0 +1,287 @@
+"""
+Tests for synology_download helpers
+"""
+
+import io
+import os
+import time
+import argparse
+import pytest
+import synology_download
+from synology_download import (
+    DownloadProgress, contiguous_prefix, download_stream, find_download, parse_share_info,
+    positive_int, probe_chunk_size, read_share_info
+)
+
+
+class FakeResponse(io.BytesIO):
+    """http.client-style response over a byte string"""
+
+    def isclosed(self):
+        return self.tell() == len(self.getvalue())
+
+
+class FakeConnection:
+    """Connection that serves the same body for every request"""
+
+    def __init__(self, body):
+        self.body = body
+        self.requests = 0
+        self.response = None
+
+    def request(self, method, path, headers=None):
+        self.requests += 1
+
+    def getresponse(self):
+        self.response = FakeResponse(self.body)
+        return self.response
+
+    def close(self):
+        pass
+
+
+LARGE_SHARE = (
+    b'SYNO.SDS.ExtraSession = {"filename": "movie.mkv", "sharing_status": "none", '
+    b'"pad": "' + b'a' * (1 << 20) + b'"};'
+)
+NESTED_SHARE = b'SYNO.SDS.ExtraSession = {"data": {"filename": "nested.mkv", "sharing_status": "password"}};'
+
+
+class TestDownloadProgress:
+    """Sidecar recording partial download progress"""
+
+    def test_round_trip(self, tmp_path):
+        """Saved offset and validator are read back by a later run"""
+        output = str(tmp_path / "movie.mkv")
+        DownloadProgress(output, '"v1"').save(4096)
+
+        assert DownloadProgress(output).load() == (4096, '"v1"')
+
+    def test_missing_or_corrupt(self, tmp_path):
+        """No usable sidecar means nothing to resume"""
+        output = str(tmp_path / "movie.mkv")
+        progress = DownloadProgress(output)
+        assert progress.load() == (0, None)
+
+        with open(output + synology_download.PROGRESS_SUFFIX, 'w') as f:
+            f.write("{truncated")
+        assert progress.load() == (0, None)
+
+    def test_clear(self, tmp_path):
+        """clear() removes the sidecar and tolerates it being absent"""
+        output = str(tmp_path / "movie.mkv")
+        progress = DownloadProgress(output)
+        progress.save(1)
+        progress.clear()
+        progress.clear()
+
+        assert not os.path.exists(output + synology_download.PROGRESS_SUFFIX)
+
+
+class TestDownloadStream:
+    """Single-connection streaming into the output file"""
+
+    def test_complete(self, tmp_path):
+        """A full body is written and its offset recorded"""
+        output = str(tmp_path / "movie.mkv")
+        progress = DownloadProgress(output)
+        download_stream(io.BytesIO(b"x" * 1000), output, 1000, progress, chunk_size=256)
+
+        assert os.path.getsize(output) == 1000
+        assert progress.load()[0] == 1000
+
+    def test_connection_dropped(self, tmp_path):
+        """A body that ends early raises and leaves the sidecar for a resume"""
+        output = str(tmp_path / "movie.mkv")
+        progress = DownloadProgress(output)
+
+        with pytest.raises(IOError, match="incomplete"):
+            download_stream(io.BytesIO(b"x" * 400), output, 1000, progress, chunk_size=256)
+
+        assert os.path.getsize(output) == 400
+        assert progress.load()[0] == 400
+
+
+class HeaderResponse(FakeResponse):
+    """Response with a status line and headers"""
+
+    def __init__(self, status, headers=None, body=b""):
+        super().__init__(body)
+        self.status = status
+        self.reason = "Reason"
+        self.headers = headers or {}
+
+
+class RoutedConnection:
+    """Connection that answers each (method, path) from a table"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        self.pending = None
+
+    def request(self, method, path, headers=None):
+        self.requests.append((method, path))
+        self.pending = self.routes.get((method, path)) or HeaderResponse(404)
+
+    def getresponse(self):
+        return self.pending
+
+    def close(self):
+        pass
+
+
+FILE_HEADERS = {"Content-Length": "1000", "Accept-Ranges": "bytes", "ETag": '"v1"'}
+
+
+class TestFindDownload:
+    """Probing candidate download paths"""
+
+    def test_follows_redirect(self):
+        """A 3xx is followed to the URL named by Location"""
+        conn = RoutedConnection({
+            ("HEAD", "/fsdownload/abc"): HeaderResponse(302, {"Location": "/files/movie.mkv"}),
+            ("HEAD", "/files/movie.mkv"): HeaderResponse(200, FILE_HEADERS),
+        })
+        found = find_download(conn, "http://nas:5000", ["/fsdownload/abc"])
+
+        assert found == ("http://nas:5000/files/movie.mkv", 1000, True, '"v1"')
+
+    def test_head_rejected_falls_back_to_get(self):
+        """Servers that refuse HEAD are probed with a GET"""
+        conn = RoutedConnection({
+            ("HEAD", "/fsdownload/abc"): HeaderResponse(405),
+            ("GET", "/fsdownload/abc"): HeaderResponse(200, FILE_HEADERS, b"x" * 1000),
+        })
+        found = find_download(conn, "http://nas:5000", ["/fsdownload/abc"])
+
+        assert found == ("http://nas:5000/fsdownload/abc", 1000, True, '"v1"')
+        assert conn.requests == [("HEAD", "/fsdownload/abc"), ("GET", "/fsdownload/abc")]
+
+    def test_redirect_loop_moves_on(self):
+        """Endless redirects give up on that path and try the next one"""
+        conn = RoutedConnection({
+            ("HEAD", "/loop"): HeaderResponse(302, {"Location": "/loop"}),
+            ("HEAD", "/file"): HeaderResponse(200, FILE_HEADERS),
+        })
+        found = find_download(conn, "http://nas:5000", ["/loop", "/file"])
+
+        assert found[0] == "http://nas:5000/file"
+        assert conn.requests.count(("HEAD", "/loop")) == synology_download.MAX_REDIRECTS + 1
+
+
+@pytest.mark.parametrize("written,expected", [
+    ([10, 10, 5], 25),
+    ([10, 4, 10], 14),
+    ([0, 10, 10], 0),
+    ([10, 10, 10], 30),
+])
+def test_contiguous_prefix(written, expected):
+    """Only bytes reachable from the start of the file without a gap count"""
+    ranges = [(0, 9), (10, 19), (20, 29)]
+    assert contiguous_prefix(ranges, written) == expected
+
+
+class TestParseShareInfo:
+    """Parsing the share session JavaScript"""
+
+    def test_json_object(self):
+        """A plain JSON object is parsed directly"""
+        content = 'SYNO.SDS.ExtraSession = {"filename": "movie.mkv", "sharing_status": "none"};'
+        assert parse_share_info(content) == {"filename": "movie.mkv", "sharing_status": "none"}
+
+    def test_missing_status(self):
+        """A share without sharing_status reports it as None"""
+        content = 'SYNO.SDS.ExtraSession = {"filename": "movie.mkv"};'
+        assert parse_share_info(content) == {"filename": "movie.mkv", "sharing_status": None}
+
+    def test_javascript_falls_back_to_scan(self):
+        """Non-JSON JavaScript is scanned for the first value of each field"""
+        content = (
+            'SYNO.SDS.ExtraSession = {isPublic: true, "filename" : "movie.mkv", '
+            '"sharing_status":"password", "filename": "other.mkv"};'
+        )
+        assert parse_share_info(content) == {"filename": "movie.mkv", "sharing_status": "password"}
+
+    def test_nested_fields(self):
+        """Fields below the top level are found by the scan"""
+        assert parse_share_info(NESTED_SHARE.decode()) == {
+            "filename": "nested.mkv", "sharing_status": "password"
+        }
+
+    def test_no_fields(self):
+        """A response without the fields yields nothing"""
+        assert parse_share_info("SYNO.SDS.ExtraSession = {};") == {}
+
+
+class TestReadShareInfo:
+    """Reading the share session response"""
+
+    @pytest.fixture(params=["ijson", "plain"])
+    def mode(self, request, monkeypatch):
+        """Run each test with ijson streaming and with the plain regex/JSON path"""
+        if request.param == "ijson":
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(synology_download, "ijson", None)
+        return request.param
+
+    def test_top_level_fields(self, mode):
+        """Top-level fields are read without consuming the whole body when streaming"""
+        conn = FakeConnection(LARGE_SHARE)
+        info = read_share_info(conn, "/share")
+
+        assert info == {"filename": "movie.mkv", "sharing_status": "none"}
+        if mode == "ijson":
+            # Stops reading once both fields are seen
+            assert conn.response.tell() < len(LARGE_SHARE)
+
+    def test_nested_fields_fall_back(self, mode):
+        """Fields the stream parser can't see are found by the full parse"""
+        info = read_share_info(FakeConnection(NESTED_SHARE), "/share")
+        assert info == {"filename": "nested.mkv", "sharing_status": "password"}
+
+    def test_not_a_session_response(self, mode):
+        """Responses without the session marker are rejected"""
+        assert read_share_info(FakeConnection(b"<html>login</html>"), "/share") is None
+
+
+class SlowReads(io.BytesIO):
+    """Response where every read() call costs a fixed delay"""
+
+    def read(self, n=-1):
+        time.sleep(0.001)
+        return super().read(n)
+
+
+class TestProbeChunkSize:
+    """Read size autotuning"""
+
+    @pytest.fixture(autouse=True)
+    def small_probe(self, monkeypatch):
+        """Shrink the probe so tests stay fast"""
+        monkeypatch.setattr(synology_download, "CHUNK_CANDIDATES", (1024, 16 * 1024))
+        monkeypatch.setattr(synology_download, "CHUNK_SIZE", 1024)
+        monkeypatch.setattr(synology_download, "PROBE_BYTES", 64 * 1024)
+
+    def test_picks_faster_size_and_copies_everything(self):
+        """Per-call overhead favours larger reads; probed bytes are still written"""
+        data = os.urandom(256 * 1024)
+        out = io.BytesIO()
+
+        assert probe_chunk_size(SlowReads(data), out) == 16 * 1024
+        assert data.startswith(out.getvalue())
+        assert len(out.getvalue()) == 3 * 64 * 1024
+
+    def test_short_stream_keeps_default(self):
+        """A stream that ends during the probe keeps the default size"""
+        out = io.BytesIO()
+        assert probe_chunk_size(io.BytesIO(b"x" * 100), out) == 1024
+        assert out.getvalue() == b"x" * 100
+
+
+@pytest.mark.parametrize("value", ["0", "-4", "abc"])
+def test_positive_int_rejects(value):
+    """--chunk-size only accepts sizes greater than zero"""
+    with pytest.raises((argparse.ArgumentTypeError, ValueError)):
+        positive_int(value)
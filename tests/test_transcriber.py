@@ -0,0 +1,114 @@
+"""
+Tests for transcriber module
+"""
+
+import threading
+import time
+from src.transcriber import Transcriber, TranscriberConfig
+
+
+def make_chunked(**kwargs):
+    """Transcriber whose VAD and model are replaced by recording fakes"""
+    t = Transcriber(TranscriberConfig(chunked=True, **kwargs))
+    t.calls = []
+    t.active = t.peak = 0
+    lock = threading.Lock()
+
+    t._chunk_audio = lambda path: iter([(0.0, "a"), (10.0, "b"), (20.0, "c")])
+
+    def run_model(audio, options):
+        with lock:
+            t.calls.append((audio, options.get("language")))
+            t.active += 1
+            t.peak = max(t.peak, t.active)
+        time.sleep(0.01)
+        with lock:
+            t.active -= 1
+        language = options.get("language") or {"a": "en", "b": "de", "c": "fr"}[audio]
+        return {"segments": [{"start": 1.0, "end": 2.0, "text": audio}], "language": language}
+
+    t._run_model = run_model
+    return t
+
+
+class TestChunkedTranscription:
+    """VAD-chunked transcription"""
+
+    def test_language_detected_once(self):
+        """The first chunk's language is pinned on every other chunk"""
+        t = make_chunked(chunk_workers=4, max_parallel_gpu=4)
+        result = t._transcribe_chunked("movie.mp4", {"task": "transcribe"})
+
+        assert result["language"] == "en"
+        assert sorted(t.calls) == [("a", None), ("b", "en"), ("c", "en")]
+        assert [s["start"] for s in result["segments"]] == [1.0, 11.0, 21.0]
+
+    def test_concurrency_bounded_by_gpu_slots(self):
+        """No more chunks run at once than max_parallel_gpu allows"""
+        t = make_chunked(chunk_workers=4, max_parallel_gpu=1, language="en")
+        t._transcribe_chunked("movie.mp4", {"language": "en"})
+
+        assert t.peak == 1
+
+
+class TestDecodeOutsideSlot:
+    """Audio decoding does not hold an inference slot"""
+
+    def test_decode_before_slot(self, tmp_path):
+        """Decoding runs without a slot; detection runs inside one"""
+        media = tmp_path / "movie.mp4"
+        media.write_bytes(b"\0")
+        t = Transcriber(TranscriberConfig(backend="openai-whisper", max_parallel_gpu=1))
+        t.model = object()
+        held = {}
+
+        def decode(path):
+            # A free slot means decoding runs outside the semaphore
+            held["decode"] = not t._inference_slots.acquire(blocking=False)
+            if not held["decode"]:
+                t._inference_slots.release()
+            return "samples"
+
+        def detect(audio):
+            held["detect"] = not t._inference_slots.acquire(blocking=False)
+            return "en"
+
+        t._decode_audio = decode
+        t._detect_language = detect
+        t._run_model = lambda audio, options: {"segments": [], "language": options["language"]}
+
+        result = t.transcribe(str(media))
+        assert result["language"] == "en"
+        assert held == {"decode": False, "detect": True}
+
+    def test_decode_lookahead_bounded(self, tmp_path):
+        """Concurrent callers hold at most max_parallel_gpu + 1 decoded files"""
+        media = tmp_path / "movie.mp4"
+        media.write_bytes(b"\0")
+        t = Transcriber(TranscriberConfig(backend="faster-whisper", max_parallel_gpu=1))
+        t.model = object()
+        lock = threading.Lock()
+        state = {"alive": 0, "peak": 0}
+
+        def decode(path):
+            with lock:
+                state["alive"] += 1
+                state["peak"] = max(state["peak"], state["alive"])
+            return "samples"
+
+        def run_model(audio, options):
+            time.sleep(0.01)
+            with lock:
+                state["alive"] -= 1
+            return {"segments": [], "language": "en"}
+
+        t._decode_audio = decode
+        t._run_model = run_model
+
+        threads = [threading.Thread(target=t.transcribe, args=(str(media),)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert state == {"alive": 0, "peak": 2}
@@ -0,0 +1,221 @@
+"""
+Tests for translator module
+"""
+
+import asyncio
+import threading
+import pytest
+from src import translator as translator_module
+from src.translator import Translator, TranslatorConfig, close_shared_clients
+
+
+class FakeClient:
+    """Stand-in provider client that records close()"""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def make_translator():
+    """Build translators that share a fake client under the same cache key"""
+    def make(**kwargs):
+        kwargs.setdefault("api_key", "test-key")
+        t = Translator(TranslatorConfig(**kwargs))
+        t.client = translator_module._get_shared_client(
+            (t.config.provider, t.config.api_key), FakeClient
+        )
+        return t
+
+    yield make
+    close_shared_clients()
+
+
+class TestSharedClients:
+    """Lifetime of pooled provider clients"""
+
+    def test_close_keeps_shared_client_open(self, make_translator):
+        """Closing one translator does not close the client others use"""
+        a = make_translator()
+        b = make_translator()
+        assert a.client is b.client
+
+        a.close()
+        assert a.client is None
+        assert not b.client.closed
+
+    def test_close_shared_clients(self, make_translator):
+        """close_shared_clients closes and forgets every pooled client"""
+        client = make_translator().client
+
+        close_shared_clients()
+        assert client.closed
+        assert make_translator().client is not client
+
+
+class TestTranslationCache:
+    """Bounded cache of context-free translations"""
+
+    def test_evicts_oldest(self, monkeypatch):
+        """The oldest entry is dropped once the cache is full"""
+        monkeypatch.setattr(translator_module, "TRANSLATION_CACHE_SIZE", 2)
+        t = Translator(TranslatorConfig(api_key="test-key"))
+        for i in range(3):
+            t._cache_put(("text", i), str(i))
+
+        assert list(t._cache) == [("text", 1), ("text", 2)]
+
+    def test_concurrent_puts(self, monkeypatch):
+        """Worker threads sharing a translator can fill and evict concurrently"""
+        monkeypatch.setattr(translator_module, "TRANSLATION_CACHE_SIZE", 8)
+        t = Translator(TranslatorConfig(api_key="test-key"))
+        errors = []
+
+        def fill(worker):
+            try:
+                for i in range(5000):
+                    t._cache_put((worker, i), "x")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=fill, args=(w,)) for w in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(t._cache) <= 8
+
+
+class FakeAsyncClient:
+    """Stand-in async provider client that records close()"""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def async_translator(monkeypatch):
+    """Context-free translator whose async provider calls are recorded"""
+    t = Translator(TranslatorConfig(api_key="test-key", context_aware=False, concurrency=3))
+    t.client_instance = FakeAsyncClient()
+    t.calls = []
+    t.fail_on = None
+    t.active = t.peak = 0
+
+    async def atranslate(client, text, context=None):
+        t.calls.append(text)
+        t.active += 1
+        t.peak = max(t.peak, t.active)
+        # Later segments finish first, so order must come from the input
+        await asyncio.sleep(0.02 / len(t.calls))
+        t.active -= 1
+        if text == t.fail_on:
+            raise RuntimeError("provider error")
+        return text.upper()
+
+    monkeypatch.setattr(t, "_create_async_client", lambda: t.client_instance)
+    monkeypatch.setattr(t, "_atranslate", atranslate)
+    return t
+
+
+def make_segments(*texts):
+    """One-second segments with the given texts"""
+    return [{"start": float(i), "end": i + 1.0, "text": text} for i, text in enumerate(texts)]
+
+
+class TestConcurrentTranslation:
+    """translate_segments without context"""
+
+    def test_duplicates_share_one_request(self, async_translator):
+        """Repeated lines within a run cost a single provider call"""
+        result = async_translator.translate_segments(make_segments(" yes ", "no", " yes ", "yes", "yes"))
+
+        assert [s["text"] for s in result] == ["YES", "NO", "YES", "YES", "YES"]
+        assert sorted(async_translator.calls) == ["no", "yes"]
+
+    def test_dispatches_without_context(self, async_translator, monkeypatch):
+        """context_aware=False takes the async path, not the serial one"""
+        monkeypatch.setattr(async_translator, "_translate_segments_serial", None)
+        async_translator.translate_segments(make_segments("a"))
+        assert async_translator.calls == ["a"]
+
+    def test_preserves_order(self, async_translator):
+        """Results come back in segment order whatever order requests finish in"""
+        texts = [f"line {i}" for i in range(10)]
+        result = async_translator.translate_segments(make_segments(*texts))
+
+        assert [s["text"] for s in result] == [t.upper() for t in texts]
+        assert [s["start"] for s in result] == [float(i) for i in range(10)]
+        assert [s["original_text"] for s in result] == texts
+        assert async_translator.client_instance.closed
+
+    def test_bounded_in_flight(self, async_translator):
+        """No more than config.concurrency requests run at once"""
+        async_translator.translate_segments(make_segments(*[f"line {i}" for i in range(10)]))
+
+        assert len(async_translator.calls) == 10
+        assert async_translator.peak == 3
+
+    def test_client_closed_on_error(self, async_translator):
+        """The per-run async client is closed when a request fails"""
+        async_translator.fail_on = "bad"
+
+        with pytest.raises(RuntimeError, match="provider error"):
+            async_translator.translate_segments(make_segments("good", "bad", "fine"))
+        assert async_translator.client_instance.closed
+
+
+class TestTranslateBatch:
+    """Splitting batched translations back into segments"""
+
+    @pytest.fixture
+    def translator(self, monkeypatch):
+        """Translator whose provider call returns a canned response"""
+        t = Translator(TranslatorConfig(api_key="test-key"))
+        t.responses = []
+        monkeypatch.setattr(t, "translate_text", lambda text, context=None: t.responses.pop(0))
+        return t
+
+    @staticmethod
+    def segments(*texts):
+        """One-second segments with the given texts"""
+        return [{"start": float(i), "end": i + 1.0, "text": text} for i, text in enumerate(texts)]
+
+    def test_blank_lines_inside_translation(self, translator):
+        """A translation containing blank lines stays with its own segment"""
+        translator.responses = ["[1] Hola\n\nmundo\n\n[2] Adiós"]
+        result = translator.translate_batch(self.segments("Hello world", "Goodbye"))
+
+        assert [s["text"] for s in result] == ["Hola\n\nmundo", "Adiós"]
+        assert result[0]["original_text"] == "Hello world"
+
+    def test_reordered_markers(self, translator):
+        """Segments are matched by marker number, not position"""
+        translator.responses = ["[2] Dos\n[1] Uno"]
+        result = translator.translate_batch(self.segments("One", "Two"))
+
+        assert [s["text"] for s in result] == ["Uno", "Dos"]
+
+    def test_missing_marker_keeps_original(self, translator):
+        """A segment the model dropped keeps its original text"""
+        translator.responses = ["[1] Uno"]
+        segments = self.segments("One", "Two")
+        result = translator.translate_batch(segments)
+
+        assert result[0]["text"] == "Uno"
+        assert result[1] is segments[1]
+
+    def test_batches(self, translator):
+        """Each batch numbers its markers from 1"""
+        translator.responses = ["[1] a\n[2] b", "[1] c"]
+        result = translator.translate_batch(self.segments("A", "B", "C"), batch_size=2)
+
+        assert [s["text"] for s in result] == ["a", "b", "c"]
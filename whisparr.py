@@ -11,7 +11,17 @@ import argparse
 from pathlib import Path
 from typing import Optional
 
-from src import Config, FileProcessor, __version__
+# Only the version is needed up front; commands import what they use so that
+# --help, --version and config commands don't load whisper/torch
+from src import __version__
+
+
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
 
 
 def setup_logging(level: str = "INFO"):
@@ -22,33 +32,50 @@ def setup_logging(level: str = "INFO"):
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
     """
     logging.basicConfig(
-        level=getattr(logging, level.upper()),
+        level=_LEVELS.get(level.upper(), logging.INFO),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
 
+# CLI argument -> config key for options that map one-to-one
+_CLI_TO_CONFIG = (
+    ("model", "whisper.model_size"),
+    ("language", "whisper.language"),
+    ("format", "subtitle.format"),
+    ("device", "whisper.device"),
+    ("translate_provider", "translation.provider"),
+    ("translate_model", "translation.model"),
+)
+
+
+def apply_cli_overrides(config, args):
+    """
+    Apply CLI arguments shared by the file and directory commands to config
+
+    Args:
+        config: Configuration to update
+        args: Parsed CLI arguments
+    """
+    for attr, key in _CLI_TO_CONFIG:
+        value = getattr(args, attr, None)
+        if value:
+            config.set(key, value)
+
+    # Translation options
+    translate = getattr(args, 'translate', None)
+    if translate:
+        config.set("translation.enabled", True)
+        config.set("translation.target_language", translate)
+
+
 def process_file_command(args):
     """Handle the 'file' command"""
+    from src import Config, FileProcessor
+
     config = Config(args.config) if args.config else Config()
 
     # Override config with CLI arguments
-    if args.model:
-        config.set("whisper.model_size", args.model)
-    if args.language:
-        config.set("whisper.language", args.language)
-    if args.format:
-        config.set("subtitle.format", args.format)
-    if args.device:
-        config.set("whisper.device", args.device)
-
-    # Translation options
-    if hasattr(args, 'translate') and args.translate:
-        config.set("translation.enabled", True)
-        config.set("translation.target_language", args.translate)
-    if hasattr(args, 'translate_provider') and args.translate_provider:
-        config.set("translation.provider", args.translate_provider)
-    if hasattr(args, 'translate_model') and args.translate_model:
-        config.set("translation.model", args.translate_model)
+    apply_cli_overrides(config, args)
 
     # Setup logging
     setup_logging(args.log_level or config.get("logging.level", "INFO"))
@@ -70,28 +97,16 @@ def process_file_command(args):
 
 def process_directory_command(args):
     """Handle the 'directory' command"""
+    from src import Config, FileProcessor
+
     config = Config(args.config) if args.config else Config()
 
     # Override config with CLI arguments
-    if args.model:
-        config.set("whisper.model_size", args.model)
-    if args.language:
-        config.set("whisper.language", args.language)
-    if args.format:
-        config.set("subtitle.format", args.format)
-    if args.device:
-        config.set("whisper.device", args.device)
+    apply_cli_overrides(config, args)
     if args.overwrite:
+        # An explicit --overwrite regenerates everything, up-to-date or not
         config.set("processing.overwrite_existing", True)
-
-    # Translation options
-    if hasattr(args, 'translate') and args.translate:
-        config.set("translation.enabled", True)
-        config.set("translation.target_language", args.translate)
-    if hasattr(args, 'translate_provider') and args.translate_provider:
-        config.set("translation.provider", args.translate_provider)
-    if hasattr(args, 'translate_model') and args.translate_model:
-        config.set("translation.model", args.translate_model)
+        config.set("processing.skip_if_newer", False)
 
     # Setup logging
     setup_logging(args.log_level or config.get("logging.level", "INFO"))
@@ -113,6 +128,8 @@ def process_directory_command(args):
 
 def config_command(args):
     """Handle the 'config' command"""
+    from src import Config
+
     if args.action == "generate":
         config = Config()
         output_path = args.output or "config.json"
@@ -122,7 +139,11 @@ def config_command(args):
     elif args.action == "show":
         config = Config(args.config) if args.config else Config()
         import json
-        print(json.dumps(config.to_dict(), indent=2))
+        if sys.stdout.isatty():
+            print(json.dumps(config.to_dict(), indent=2))
+        else:
+            # Piped to another tool: skip the whitespace
+            print(json.dumps(config.to_dict(), separators=(',', ':')))
         return 0
 
 
@@ -158,40 +179,32 @@ Examples:
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
+    # Options shared by the file and directory commands
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-m', '--model', choices=['tiny', 'base', 'small', 'medium', 'large'],
+                        help='Whisper model size')
+    common.add_argument('-l', '--language', help='Source language code (e.g., en, es, fr)')
+    common.add_argument('-f', '--format', choices=['srt', 'vtt'], help='Subtitle format')
+    common.add_argument('-d', '--device', choices=['cpu', 'cuda'], help='Device to use')
+    common.add_argument('-c', '--config', help='Configuration file path')
+    common.add_argument('--translate', help='Enable translation to target language (e.g., English, Spanish, French)')
+    common.add_argument('--translate-provider', choices=['openai', 'anthropic'], help='LLM provider for translation')
+    common.add_argument('--translate-model', help='LLM model for translation (e.g., gpt-4o-mini, claude-3-5-sonnet-20241022)')
+    common.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='Logging level')
+
     # File command
-    file_parser = subparsers.add_parser('file', help='Process a single file')
+    file_parser = subparsers.add_parser('file', parents=[common], help='Process a single file')
     file_parser.add_argument('input', help='Input video/audio file')
     file_parser.add_argument('-o', '--output', help='Output subtitle file path')
-    file_parser.add_argument('-m', '--model', choices=['tiny', 'base', 'small', 'medium', 'large'],
-                            help='Whisper model size')
-    file_parser.add_argument('-l', '--language', help='Source language code (e.g., en, es, fr)')
-    file_parser.add_argument('-f', '--format', choices=['srt', 'vtt'], help='Subtitle format')
-    file_parser.add_argument('-d', '--device', choices=['cpu', 'cuda'], help='Device to use')
-    file_parser.add_argument('-c', '--config', help='Configuration file path')
-    file_parser.add_argument('--translate', help='Enable translation to target language (e.g., English, Spanish, French)')
-    file_parser.add_argument('--translate-provider', choices=['openai', 'anthropic'], help='LLM provider for translation')
-    file_parser.add_argument('--translate-model', help='LLM model for translation (e.g., gpt-4o-mini, claude-3-5-sonnet-20241022)')
-    file_parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
-                            help='Logging level')
     file_parser.set_defaults(func=process_file_command)
 
     # Directory command
-    dir_parser = subparsers.add_parser('directory', help='Process all files in a directory')
+    dir_parser = subparsers.add_parser('directory', parents=[common], help='Process all files in a directory')
     dir_parser.add_argument('input', help='Input directory')
     dir_parser.add_argument('-o', '--output', help='Output directory')
     dir_parser.add_argument('-r', '--recursive', action='store_true', help='Process subdirectories')
-    dir_parser.add_argument('-m', '--model', choices=['tiny', 'base', 'small', 'medium', 'large'],
-                           help='Whisper model size')
-    dir_parser.add_argument('-l', '--language', help='Source language code (e.g., en, es, fr)')
-    dir_parser.add_argument('-f', '--format', choices=['srt', 'vtt'], help='Subtitle format')
-    dir_parser.add_argument('-d', '--device', choices=['cpu', 'cuda'], help='Device to use')
-    dir_parser.add_argument('-c', '--config', help='Configuration file path')
     dir_parser.add_argument('--overwrite', action='store_true', help='Overwrite existing subtitle files')
-    dir_parser.add_argument('--translate', help='Enable translation to target language (e.g., English, Spanish, French)')
-    dir_parser.add_argument('--translate-provider', choices=['openai', 'anthropic'], help='LLM provider for translation')
-    dir_parser.add_argument('--translate-model', help='LLM model for translation (e.g., gpt-4o-mini, claude-3-5-sonnet-20241022)')
-    dir_parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
-                           help='Logging level')
     dir_parser.set_defaults(func=process_directory_command)
 
     # Config command